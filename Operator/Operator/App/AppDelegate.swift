@@ -109,64 +109,37 @@ class ToolbarDelegate: NSObject, NSToolbarDelegate {
     }
     
     func toolbar(_ toolbar: NSToolbar, itemForItemIdentifier itemIdentifier: NSToolbarItem.Identifier, willBeInsertedIntoToolbar flag: Bool) -> NSToolbarItem? {
-        let item = NSToolbarItem(itemIdentifier: itemIdentifier)
+        guard let spec = Self.itemSpecs[itemIdentifier] else { return nil }
         
-        switch itemIdentifier {
-        case .refresh:
-            item.label = "Refresh"
-            item.paletteLabel = "Refresh"
-            item.toolTip = "Refresh Now"
-            item.image = NSImage(systemSymbolName: "arrow.clockwise", accessibilityDescription: "Refresh")
-            item.action = #selector(refreshAction)
-            item.target = self
-            
-        case .networkDiagnostics:
-            item.label = "Network Diagnostics"
-            item.paletteLabel = "Network Diagnostics"
-            item.toolTip = "Network Diagnostics"
-            item.image = NSImage(systemSymbolName: "stethoscope", accessibilityDescription: "Network Diagnostics")
-            item.action = #selector(networkDiagnosticsAction)
-            item.target = self
-            
-        case .processes:
-            item.label = "Processes"
-            item.paletteLabel = "Processes"
-            item.toolTip = "View Processes"
-            item.image = NSImage(systemSymbolName: "list.bullet.rectangle", accessibilityDescription: "Processes")
-            item.action = #selector(processesAction)
-            item.target = self
-            
-        case .history:
-            item.label = "History"
-            item.paletteLabel = "History"
-            item.toolTip = "View History"
-            item.image = NSImage(systemSymbolName: "clock.arrow.circlepath", accessibilityDescription: "History")
-            item.action = #selector(historyAction)
-            item.target = self
-            
-        case .export:
-            item.label = "Export"
-            item.paletteLabel = "Export"
-            item.toolTip = "Export Data"
-            item.image = NSImage(systemSymbolName: "square.and.arrow.up", accessibilityDescription: "Export")
-            item.action = #selector(exportAction)
-            item.target = self
-            
-        case .settings:
-            item.label = "Settings"
-            item.paletteLabel = "Settings"
-            item.toolTip = "Settings"
-            item.image = NSImage(systemSymbolName: "gearshape", accessibilityDescription: "Settings")
-            item.action = #selector(settingsAction)
-            item.target = self
-            
-        default:
-            return nil
-        }
+        let item = NSToolbarItem(itemIdentifier: itemIdentifier)
+        item.label = spec.label
+        item.paletteLabel = spec.label
+        item.toolTip = spec.toolTip
+        item.image = NSImage(systemSymbolName: spec.symbol, accessibilityDescription: spec.label)
+        item.action = spec.action
+        item.target = self
         
         return item
     }
     
+    // MARK: - Item Table
+    
+    private struct ItemSpec {
+        let label: String
+        let toolTip: String
+        let symbol: String
+        let action: Selector
+    }
+    
+    private static let itemSpecs: [NSToolbarItem.Identifier: ItemSpec] = [
+        .refresh: ItemSpec(label: "Refresh", toolTip: "Refresh Now", symbol: "arrow.clockwise", action: #selector(ToolbarDelegate.refreshAction)),
+        .networkDiagnostics: ItemSpec(label: "Network Diagnostics", toolTip: "Network Diagnostics", symbol: "stethoscope", action: #selector(ToolbarDelegate.networkDiagnosticsAction)),
+        .processes: ItemSpec(label: "Processes", toolTip: "View Processes", symbol: "list.bullet.rectangle", action: #selector(ToolbarDelegate.processesAction)),
+        .history: ItemSpec(label: "History", toolTip: "View History", symbol: "clock.arrow.circlepath", action: #selector(ToolbarDelegate.historyAction)),
+        .export: ItemSpec(label: "Export", toolTip: "Export Data", symbol: "square.and.arrow.up", action: #selector(ToolbarDelegate.exportAction)),
+        .settings: ItemSpec(label: "Settings", toolTip: "Settings", symbol: "gearshape", action: #selector(ToolbarDelegate.settingsAction))
+    ]
+    
     @objc func refreshAction() {
         NotificationCenter.default.post(name: NSNotification.Name("ForceRefresh"), object: nil)
     }
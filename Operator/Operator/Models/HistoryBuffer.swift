@@ -0,0 +1,95 @@
+//
+//  HistoryBuffer.swift
+//  Operator
+//
+//  Bounded metric history with running aggregates.
+//
+
+import Foundation
+
+/// Fixed-length series of recent samples that tracks its sum, minimum and
+/// maximum as values are appended, so views can show stats and scale graphs
+/// without rescanning.
+struct HistoryBuffer {
+    private(set) var values: [Double] = []
+    private(set) var minimum: Double?
+    private(set) var maximum: Double?
+    private(set) var sum: Double = 0
+
+    /// Set once per series and carried along by copies and appends, so a view
+    /// can tell a newer copy of its history from a different history
+    let id = UUID()
+
+    /// Bumped on every change, so views fed from one history can tell whether
+    /// it moved without comparing samples
+    private(set) var version = 0
+
+    var average: Double? {
+        values.isEmpty ? nil : sum / Double(values.count)
+    }
+
+    init() {}
+
+    init(_ values: [Double]) {
+        self.values = values
+        recomputeExtremes()
+    }
+
+    /// Append a sample, dropping the oldest ones beyond `maxCount`
+    mutating func append(_ value: Double, maxCount: Int) {
+        version &+= 1
+        values.append(value)
+        sum += value
+        minimum = Swift.min(minimum ?? value, value)
+        maximum = Swift.max(maximum ?? value, value)
+
+        guard values.count > maxCount else { return }
+
+        // Only rescan when an evicted sample was one of the extremes
+        let overflow = values.count - maxCount
+        let evicted = values[..<overflow]
+        let evictedExtreme = evicted.contains { $0 == minimum || $0 == maximum }
+        sum -= evicted.reduce(0, +)
+        values.removeFirst(overflow)
+        if evictedExtreme {
+            recomputeExtremes()
+        }
+    }
+
+    /// O(1) check that `other` is this same series with no appends since,
+    /// without comparing samples
+    func isUnchanged(from other: HistoryBuffer) -> Bool {
+        id == other.id && version == other.version
+    }
+
+    /// Full rescan; also resets any floating-point drift in the running sum
+    private mutating func recomputeExtremes() {
+        minimum = values.min()
+        maximum = values.max()
+        sum = values.reduce(0, +)
+    }
+}
+
+// MARK: - Collection
+
+extension HistoryBuffer: RandomAccessCollection {
+    var startIndex: Int { values.startIndex }
+    var endIndex: Int { values.endIndex }
+
+    subscript(position: Int) -> Double {
+        values[position]
+    }
+}
+
+extension HistoryBuffer: Equatable {
+    /// Equal when the samples match; identity and version only track changes
+    static func == (lhs: HistoryBuffer, rhs: HistoryBuffer) -> Bool {
+        lhs.values == rhs.values
+    }
+}
+
+extension HistoryBuffer: ExpressibleByArrayLiteral {
+    init(arrayLiteral elements: Double...) {
+        self.init(elements)
+    }
+}
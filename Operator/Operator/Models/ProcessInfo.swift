@@ -6,6 +6,7 @@
 //
 
 import Foundation
+import SwiftUI
 
 struct ProcessInfoModel: Identifiable, Equatable {
     let id: Int32  // PID
@@ -63,6 +64,16 @@ enum ProcessState: String {
         case .unknown: return "questionmark.circle.fill"
         }
     }
+
+    var color: Color {
+        switch self {
+        case .running: return .green
+        case .sleeping: return .blue
+        case .stopped: return .orange
+        case .zombie: return .red
+        case .unknown: return .gray
+        }
+    }
 }
 
 enum ProcessSortKey: String, CaseIterable {
@@ -19,7 +19,7 @@ struct CPUMetrics: Equatable {
     var coreCount: Int = 0
     var threadCount: Int = 0
     var frequency: Double? = nil  // MHz, Intel only
-    var history: [Double] = []
+    var history = HistoryBuffer()
 
     static let empty = CPUMetrics()
 
@@ -40,7 +40,7 @@ struct MemoryMetrics: Equatable {
     var compressedBytes: UInt64 = 0
     var swapTotalBytes: UInt64 = 0
     var swapUsedBytes: UInt64 = 0
-    var history: [Double] = []
+    var history = HistoryBuffer()
 
     static let empty = MemoryMetrics()
 
@@ -54,12 +54,6 @@ struct MemoryMetrics: Equatable {
         return Double(swapUsedBytes) / Double(swapTotalBytes) * 100
     }
 
-    var totalGB: Double { Double(totalBytes) / 1_073_741_824 }
-    var usedGB: Double { Double(usedBytes) / 1_073_741_824 }
-    var freeGB: Double { Double(freeBytes) / 1_073_741_824 }
-    var swapTotalGB: Double { Double(swapTotalBytes) / 1_073_741_824 }
-    var swapUsedGB: Double { Double(swapUsedBytes) / 1_073_741_824 }
-
     var statusColor: StatusColor {
         StatusColor.from(percentage: usagePercent)
     }
@@ -72,9 +66,11 @@ struct NetworkMetrics: Equatable {
     var bytesReceived: UInt64 = 0
     var uploadSpeed: Double = 0.0  // bytes per second
     var downloadSpeed: Double = 0.0  // bytes per second
+    var smoothedUploadSpeed: Double = 0.0  // EMA of uploadSpeed, for graphs
+    var smoothedDownloadSpeed: Double = 0.0  // EMA of downloadSpeed, for graphs
     var interfaces: [NetworkInterfaceInfo] = []
-    var uploadHistory: [Double] = []
-    var downloadHistory: [Double] = []
+    var uploadHistory = HistoryBuffer()
+    var downloadHistory = HistoryBuffer()
     var isConnected: Bool = true
     var connectionType: String = "Unknown"
 
@@ -155,10 +151,6 @@ struct VolumeInfo: Equatable, Identifiable {
         return Double(usedBytes) / Double(totalBytes) * 100
     }
 
-    var totalGB: Double { Double(totalBytes) / 1_073_741_824 }
-    var usedGB: Double { Double(usedBytes) / 1_073_741_824 }
-    var freeGB: Double { Double(freeBytes) / 1_073_741_824 }
-
     var statusColor: StatusColor {
         StatusColor.from(percentage: usagePercent)
     }
@@ -172,8 +164,10 @@ enum StatusColor {
     case yellow
     case red
 
-    static func from(percentage: Double) -> StatusColor {
-        switch percentage {
+    /// Color for each whole percent in 0..<100. Thresholds fall on integers,
+    /// so truncating the input selects the same bucket as a range match.
+    private static let percentageTable: [StatusColor] = (0..<100).map { percent in
+        switch percent {
         case 0..<50: return .green
         case 50..<70: return .blue
         case 70..<90: return .yellow
@@ -181,6 +175,12 @@ enum StatusColor {
         }
     }
 
+    static func from(percentage: Double) -> StatusColor {
+        // Negative, NaN and >= 100 all map to red, as before
+        guard percentage >= 0, percentage < 100 else { return .red }
+        return percentageTable[Int(percentage)]
+    }
+
     var swiftUIColor: Color {
         switch self {
         case .green: return .green
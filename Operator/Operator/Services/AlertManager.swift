@@ -48,6 +48,11 @@ enum AlertType: String, Codable, CaseIterable, Identifiable {
         case .processHighMemory: return 50
         }
     }
+
+    /// Rules evaluated against the process list rather than system-wide metrics
+    var isProcessAlert: Bool {
+        self == .processHighCPU || self == .processHighMemory
+    }
 }
 
 /// A configured alert rule
@@ -162,6 +167,11 @@ class AlertManager: ObservableObject {
         }
     }
 
+    /// Whether any enabled rule needs an up-to-date process list
+    var hasEnabledProcessRules: Bool {
+        rules.contains { $0.isEnabled && $0.type.isProcessAlert }
+    }
+
     /// Add a new alert rule
     func addRule(_ rule: AlertRule) {
         rules.append(rule)
@@ -25,7 +25,7 @@ struct BatteryMetrics: Equatable {
     var wattage: Double = 0.0  // Watts
     var timeToEmpty: Int? = nil  // Minutes
     var timeToFull: Int? = nil  // Minutes
-    var history: [Double] = []
+    var history = HistoryBuffer()
 
     static let empty = BatteryMetrics()
 
@@ -97,8 +97,8 @@ struct ThermalMetrics: Equatable {
     var batteryTemperature: Double = 0.0
     var fanSpeeds: [FanInfo] = []
     var thermalPressure: ThermalPressure = .nominal
-    var cpuHistory: [Double] = []
-    var gpuHistory: [Double] = []
+    var cpuHistory = HistoryBuffer()
+    var gpuHistory = HistoryBuffer()
 
     static let empty = ThermalMetrics()
 
@@ -151,7 +151,18 @@ enum ThermalPressure: String, Codable {
 
 /// Monitors battery and thermal state
 class BatteryMonitor {
-    private var previousBatteryInfo: [String: Any]?
+    private static let batteryInfoKeys = ["CycleCount", "DesignCapacity", "Temperature", "Voltage", "Amperage"]
+
+    // The AppleSmartBattery service is looked up once and held for the
+    // monitor's lifetime rather than re-matched on every sample
+    private var batteryService: io_service_t = 0
+    private var didLookUpBatteryService = false
+
+    deinit {
+        if batteryService != 0 {
+            IOObjectRelease(batteryService)
+        }
+    }
 
     func getMetrics() -> BatteryMetrics {
         var metrics = BatteryMetrics()
@@ -263,25 +274,24 @@ class BatteryMonitor {
 
     // MARK: - Private Methods
 
-    private func getBatteryInfo() -> [String: Any]? {
-        var iterator: io_iterator_t = 0
-
-        let matchingDict = IOServiceMatching("AppleSmartBattery")
-        guard IOServiceGetMatchingServices(kIOMainPortDefault, matchingDict, &iterator) == KERN_SUCCESS else {
-            return nil
+    private func getBatteryService() -> io_service_t? {
+        if !didLookUpBatteryService {
+            didLookUpBatteryService = true
+            batteryService = IOServiceGetMatchingService(kIOMainPortDefault, IOServiceMatching("AppleSmartBattery"))
         }
+        return batteryService != 0 ? batteryService : nil
+    }
 
-        defer { IOObjectRelease(iterator) }
-
-        let service = IOIteratorNext(iterator)
-        guard service != 0 else { return nil }
-
-        defer { IOObjectRelease(service) }
-
-        var props: Unmanaged<CFMutableDictionary>?
-        guard IORegistryEntryCreateCFProperties(service, &props, kCFAllocatorDefault, 0) == KERN_SUCCESS,
-              let properties = props?.takeRetainedValue() as? [String: Any] else {
-            return nil
+    private func getBatteryInfo() -> [String: Any]? {
+        guard let service = getBatteryService() else { return nil }
+
+        // Look up only the keys we read; the full property dictionary carries
+        // large nested blobs (BatteryData, charger state) we'd copy and discard
+        var properties: [String: Any] = [:]
+        for key in Self.batteryInfoKeys {
+            if let value = IORegistryEntryCreateCFProperty(service, key as CFString, kCFAllocatorDefault, 0)?.takeRetainedValue() {
+                properties[key] = value
+            }
         }
 
         return properties
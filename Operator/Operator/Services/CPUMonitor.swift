@@ -11,11 +11,10 @@ import Darwin
 class CPUMonitor {
     // Store previous CPU ticks for delta calculation
     private var previousTicks: [MachHelpers.CPUTicks] = []
-    private var previousTotalTicks = MachHelpers.CPUTicks()
 
     init() {
-        // Prime the CPU readings
-        _ = getRawCPUTicks()
+        // Prime the CPU readings so the first sample already has a baseline
+        previousTicks = getRawCPUTicks() ?? []
     }
 
     func getMetrics() -> CPUMetrics {
@@ -48,31 +47,35 @@ class CPUMonitor {
 
         // If we don't have previous data, store current and return nil
         if previousTicks.isEmpty {
-            previousTicks = currentTicks.perCore
-            previousTotalTicks = currentTicks.total
+            previousTicks = currentTicks
             return nil
         }
 
-        // Calculate per-core usage from delta
+        // Calculate per-core usage from delta, summing the deltas for the total
         var coreUsages: [Double] = []
-        for (index, current) in currentTicks.perCore.enumerated() {
+        coreUsages.reserveCapacity(currentTicks.count)
+        var totalDelta: UInt64 = 0
+        var idleDelta: UInt64 = 0
+
+        for (index, current) in currentTicks.enumerated() {
             guard index < previousTicks.count else { continue }
 
             let prev = previousTicks[index]
-            let totalDelta = current.total - prev.total
-            let idleDelta = current.idle - prev.idle
+            let coreTotalDelta = current.total - prev.total
+            let coreIdleDelta = current.idle - prev.idle
+
+            totalDelta += coreTotalDelta
+            idleDelta += coreIdleDelta
 
-            if totalDelta > 0 {
-                let usage = Double(totalDelta - idleDelta) / Double(totalDelta) * 100
+            if coreTotalDelta > 0 {
+                let usage = Double(coreTotalDelta - coreIdleDelta) / Double(coreTotalDelta) * 100
                 coreUsages.append(max(0, min(100, usage)))
             } else {
                 coreUsages.append(0)
             }
         }
 
-        // Calculate total usage from delta
-        let totalDelta = currentTicks.total.total - previousTotalTicks.total
-        let idleDelta = currentTicks.total.idle - previousTotalTicks.idle
+        // Total usage is the tick-weighted average of the cores
         let totalUsage: Double
 
         if totalDelta > 0 {
@@ -82,13 +85,12 @@ class CPUMonitor {
         }
 
         // Store current as previous for next calculation
-        previousTicks = currentTicks.perCore
-        previousTotalTicks = currentTicks.total
+        previousTicks = currentTicks
 
         return (max(0, min(100, totalUsage)), coreUsages)
     }
 
-    private func getRawCPUTicks() -> (total: MachHelpers.CPUTicks, perCore: [MachHelpers.CPUTicks])? {
+    private func getRawCPUTicks() -> [MachHelpers.CPUTicks]? {
         var cpuInfo: processor_info_array_t?
         var numCPUs: mach_msg_type_number_t = 0
         var numCPUInfo: mach_msg_type_number_t = 0
@@ -111,7 +113,7 @@ class CPUMonitor {
         }
 
         var perCoreTicks: [MachHelpers.CPUTicks] = []
-        var totalTicks = MachHelpers.CPUTicks()
+        perCoreTicks.reserveCapacity(Int(numCPUs))
 
         for i in 0..<Int(numCPUs) {
             let offset = Int(CPU_STATE_MAX) * i
@@ -123,13 +125,8 @@ class CPUMonitor {
             ticks.nice = UInt64(cpuInfo[offset + Int(CPU_STATE_NICE)])
 
             perCoreTicks.append(ticks)
-
-            totalTicks.user += ticks.user
-            totalTicks.system += ticks.system
-            totalTicks.idle += ticks.idle
-            totalTicks.nice += ticks.nice
         }
 
-        return (totalTicks, perCoreTicks)
+        return perCoreTicks
     }
 }
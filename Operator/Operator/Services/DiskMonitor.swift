@@ -11,19 +11,24 @@ import IOKit.storage
 
 class DiskMonitor {
     private var previousIOStats: (read: UInt64, write: UInt64)?
-    private var previousTimestamp: Date?
+    private var previousTimestamp: TimeInterval?
+
+    // Mounts change rarely, so the volume list is cached and only capacities are read each refresh
+    private var mountedVolumes: [(url: URL, fileSystem: String)] = []
+    private var lastVolumeListRefresh: TimeInterval = -.infinity
+    private let volumeListRefreshInterval: TimeInterval = 30
 
     func getMetrics() -> DiskMetrics {
         let volumes = getVolumes()
         let ioStats = getDiskIOStats()
 
-        let currentTime = Date()
+        let currentTime = MachHelpers.monotonicTime()
         var readSpeed: Double = 0
         var writeSpeed: Double = 0
 
         if let prev = previousIOStats,
            let prevTime = previousTimestamp {
-            let timeDelta = currentTime.timeIntervalSince(prevTime)
+            let timeDelta = currentTime - prevTime
             if timeDelta > 0 {
                 let readDelta = ioStats.read > prev.read ? ioStats.read - prev.read : 0
                 let writeDelta = ioStats.write > prev.write ? ioStats.write - prev.write : 0
@@ -48,30 +53,24 @@ class DiskMonitor {
     // MARK: - Private Methods
 
     private func getVolumes() -> [VolumeInfo] {
-        let fileManager = FileManager.default
+        if MachHelpers.monotonicTime() - lastVolumeListRefresh >= volumeListRefreshInterval {
+            refreshVolumeList()
+        }
+
         var volumes: [VolumeInfo] = []
 
-        // Get mounted volumes
-        guard let urls = fileManager.mountedVolumeURLs(
-            includingResourceValuesForKeys: [.volumeNameKey, .volumeTotalCapacityKey, .volumeAvailableCapacityKey],
-            options: [.skipHiddenVolumes]
-        ) else {
-            return volumes
-        }
+        for volume in mountedVolumes {
+            // URL caches resource values, so clear them to get current capacities
+            var url = volume.url
+            url.removeAllCachedResourceValues()
 
-        for url in urls {
             do {
                 let resourceValues = try url.resourceValues(forKeys: [
                     .volumeNameKey,
                     .volumeTotalCapacityKey,
-                    .volumeAvailableCapacityKey,
-                    .volumeIsLocalKey,
-                    .volumeIsReadOnlyKey
+                    .volumeAvailableCapacityKey
                 ])
 
-                // Skip non-local volumes
-                guard resourceValues.volumeIsLocal == true else { continue }
-
                 let name = resourceValues.volumeName ?? url.lastPathComponent
                 let total = UInt64(resourceValues.volumeTotalCapacity ?? 0)
                 let available = UInt64(resourceValues.volumeAvailableCapacity ?? 0)
@@ -83,9 +82,10 @@ class DiskMonitor {
                     totalBytes: total,
                     usedBytes: used,
                     freeBytes: available,
-                    fileSystem: getFileSystem(for: url)
+                    fileSystem: volume.fileSystem
                 ))
             } catch {
+                // Volume was unmounted since the last list refresh
                 continue
             }
         }
@@ -100,6 +100,34 @@ class DiskMonitor {
         return volumes
     }
 
+    private func refreshVolumeList() {
+        lastVolumeListRefresh = MachHelpers.monotonicTime()
+
+        // Get mounted volumes
+        guard let urls = FileManager.default.mountedVolumeURLs(
+            includingResourceValuesForKeys: [.volumeIsLocalKey, .volumeIsBrowsableKey, .volumeLocalizedFormatDescriptionKey],
+            options: [.skipHiddenVolumes]
+        ) else {
+            mountedVolumes = []
+            return
+        }
+
+        mountedVolumes = urls.compactMap { url -> (url: URL, fileSystem: String)? in
+            // Skip non-local volumes
+            guard let values = try? url.resourceValues(forKeys: [.volumeIsLocalKey, .volumeIsBrowsableKey]),
+                  values.volumeIsLocal == true else {
+                return nil
+            }
+
+            // Skip pseudo and system-support mounts (devfs, VM, Preboot, Update, ...)
+            // so we don't stat them every refresh
+            if values.volumeIsBrowsable == false || url.path.hasPrefix("/System/Volumes/") || url.path == "/dev" {
+                return nil
+            }
+            return (url: url, fileSystem: getFileSystem(for: url))
+        }
+    }
+
     private func getFileSystem(for url: URL) -> String {
         do {
             let values = try url.resourceValues(forKeys: [.volumeLocalizedFormatDescriptionKey])
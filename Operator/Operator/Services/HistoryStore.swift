@@ -110,17 +110,22 @@ class HistoryStore: ObservableObject {
 
     private let fileManager = FileManager.default
     private let encoder = JSONEncoder()
-    private let decoder = JSONDecoder()
 
     private var currentSessionStart: Date?
     private var sessionDataPoints: [MetricDataPoint] = []
     private var saveTimer: Timer?
+    private var hasUnsavedChanges = false
+    private var hasLoadedData = false
+    private var clearedBeforeLoad = false
+    private let saveQueue = DispatchQueue(label: "com.operator.history.save", qos: .utility)
 
     // Storage limits
     private let maxDataPoints = 86400 // ~24 hours at 1s intervals
     private let maxSessions = 100
     private let saveInterval: TimeInterval = 60 // Save every minute
 
+    private static let csvDateFormatter = ISO8601DateFormatter()
+
     // MARK: - Initialization
 
     private init() {
@@ -155,6 +160,7 @@ class HistoryStore: ObservableObject {
         )
 
         dataPoints.append(dataPoint)
+        hasUnsavedChanges = true
 
         // Trim old data
         if dataPoints.count > maxDataPoints {
@@ -229,29 +235,37 @@ class HistoryStore: ObservableObject {
 
         let bucketSize = data.count / maxPoints
         var aggregated: [MetricDataPoint] = []
+        aggregated.reserveCapacity(data.count / bucketSize + 1)
 
+        // Accumulate every metric in one pass over each bucket instead of
+        // copying the bucket and mapping it once per field
         for i in stride(from: 0, to: data.count, by: bucketSize) {
-            let bucket = Array(data[i..<min(i + bucketSize, data.count)])
-            if let first = bucket.first {
-                let avgCPU = bucket.map(\.cpuUsage).reduce(0, +) / Double(bucket.count)
-                let avgMemory = bucket.map(\.memoryUsage).reduce(0, +) / Double(bucket.count)
-                let avgMemBytes = bucket.map(\.memoryBytes).reduce(0, +) / UInt64(bucket.count)
-                let avgUpload = bucket.map(\.networkUpload).reduce(0, +) / Double(bucket.count)
-                let avgDownload = bucket.map(\.networkDownload).reduce(0, +) / Double(bucket.count)
-                let avgDiskRead = bucket.map(\.diskRead).reduce(0, +) / Double(bucket.count)
-                let avgDiskWrite = bucket.map(\.diskWrite).reduce(0, +) / Double(bucket.count)
-
-                aggregated.append(MetricDataPoint(
-                    timestamp: first.timestamp,
-                    cpuUsage: avgCPU,
-                    memoryUsage: avgMemory,
-                    memoryBytes: avgMemBytes,
-                    networkUpload: avgUpload,
-                    networkDownload: avgDownload,
-                    diskRead: avgDiskRead,
-                    diskWrite: avgDiskWrite
-                ))
+            let end = min(i + bucketSize, data.count)
+            var cpu = 0.0, memory = 0.0, upload = 0.0, download = 0.0, diskRead = 0.0, diskWrite = 0.0
+            var memBytes: UInt64 = 0
+
+            for j in i..<end {
+                let point = data[j]
+                cpu += point.cpuUsage
+                memory += point.memoryUsage
+                memBytes += point.memoryBytes
+                upload += point.networkUpload
+                download += point.networkDownload
+                diskRead += point.diskRead
+                diskWrite += point.diskWrite
             }
+
+            let count = Double(end - i)
+            aggregated.append(MetricDataPoint(
+                timestamp: data[i].timestamp,
+                cpuUsage: cpu / count,
+                memoryUsage: memory / count,
+                memoryBytes: memBytes / UInt64(end - i),
+                networkUpload: upload / count,
+                networkDownload: download / count,
+                diskRead: diskRead / count,
+                diskWrite: diskWrite / count
+            ))
         }
 
         return aggregated
@@ -267,18 +281,13 @@ class HistoryStore: ObservableObject {
     func exportToCSV(range: TimeRange) -> String {
         let data = getData(for: range)
         var csv = "Timestamp,CPU %,Memory %,Memory Bytes,Upload B/s,Download B/s,Disk Read B/s,Disk Write B/s\n"
+        csv.reserveCapacity(csv.utf8.count + data.count * 160)
 
-        let dateFormatter = ISO8601DateFormatter()
+        let dateFormatter = Self.csvDateFormatter
 
+        // One interpolation per row rather than eight separate appends
         for point in data {
-            csv += "\(dateFormatter.string(from: point.timestamp)),"
-            csv += "\(point.cpuUsage),"
-            csv += "\(point.memoryUsage),"
-            csv += "\(point.memoryBytes),"
-            csv += "\(point.networkUpload),"
-            csv += "\(point.networkDownload),"
-            csv += "\(point.diskRead),"
-            csv += "\(point.diskWrite)\n"
+            csv.append("\(dateFormatter.string(from: point.timestamp)),\(point.cpuUsage),\(point.memoryUsage),\(point.memoryBytes),\(point.networkUpload),\(point.networkDownload),\(point.diskRead),\(point.diskWrite)\n")
         }
 
         return csv
@@ -288,6 +297,10 @@ class HistoryStore: ObservableObject {
     func clearHistory() {
         dataPoints = []
         sessions = []
+        // A load still in flight would otherwise bring the cleared history back
+        if !hasLoadedData {
+            clearedBeforeLoad = true
+        }
         saveData()
     }
 
@@ -334,37 +347,103 @@ class HistoryStore: ObservableObject {
     }
 
     private func loadData() {
-        // Load data points
-        if let data = try? Data(contentsOf: dataURL),
-           let points = try? decoder.decode([MetricDataPoint].self, from: data) {
-            // Only keep recent data (last 24 hours)
-            let cutoff = Date().addingTimeInterval(-86400)
-            dataPoints = points.filter { $0.timestamp > cutoff }
+        // Decoding a day of samples would stall app launch, so read the files
+        // on the save queue (ahead of any write) and merge the result back in
+        let dataURL = self.dataURL
+        let sessionsURL = self.sessionsURL
+
+        saveQueue.async {
+            let decoder = JSONDecoder()
+            var points: [MetricDataPoint] = []
+            var loadedSessions: [SessionSummary] = []
+
+            // Load data points
+            if let data = try? Data(contentsOf: dataURL),
+               let decoded = try? decoder.decode([MetricDataPoint].self, from: data) {
+                // Only keep recent data (last 24 hours)
+                let cutoff = Date().addingTimeInterval(-86400)
+                points = decoded.filter { $0.timestamp > cutoff }
+            }
+
+            // Load sessions
+            if let data = try? Data(contentsOf: sessionsURL),
+               let decoded = try? decoder.decode([SessionSummary].self, from: data) {
+                loadedSessions = decoded
+            }
+
+            Task { @MainActor [weak self] in
+                self?.mergeLoadedData(points, sessions: loadedSessions)
+            }
+        }
+    }
+
+    private func mergeLoadedData(_ points: [MetricDataPoint], sessions loadedSessions: [SessionSummary]) {
+        defer {
+            hasLoadedData = true
+
+            // Write out anything saved (a cleared history, an ended session)
+            // while the load was still running
+            if hasUnsavedChanges {
+                saveData()
+            }
+        }
+
+        // The on-disk history predates a clear made while loading
+        guard !clearedBeforeLoad else { return }
+
+        // Anything recorded while loading is newer than what was on disk
+        dataPoints = points + dataPoints
+        if dataPoints.count > maxDataPoints {
+            dataPoints.removeFirst(dataPoints.count - maxDataPoints)
         }
 
-        // Load sessions
-        if let data = try? Data(contentsOf: sessionsURL),
-           let loadedSessions = try? decoder.decode([SessionSummary].self, from: data) {
-            sessions = loadedSessions
+        sessions = loadedSessions + sessions
+        if sessions.count > maxSessions {
+            sessions.removeFirst(sessions.count - maxSessions)
         }
     }
 
     private func saveData() {
-        // Save data points
-        if let data = try? encoder.encode(dataPoints) {
-            try? data.write(to: dataURL)
+        // Writing before the load has merged would truncate the files on disk;
+        // leave the changes pending so the next auto-save picks them up
+        guard hasLoadedData else {
+            hasUnsavedChanges = true
+            return
         }
 
-        // Save sessions
-        if let data = try? encoder.encode(sessions) {
-            try? data.write(to: sessionsURL)
+        hasUnsavedChanges = false
+
+        // Encoding a day of samples is expensive, so snapshot the data and
+        // encode/write on a serial background queue to keep the main actor free
+        let dataPoints = self.dataPoints
+        let sessions = self.sessions
+        let dataURL = self.dataURL
+        let sessionsURL = self.sessionsURL
+
+        saveQueue.async {
+            let encoder = JSONEncoder()
+
+            // Save data points
+            if let data = try? encoder.encode(dataPoints) {
+                try? data.write(to: dataURL, options: .atomic)
+            }
+
+            // Save sessions
+            if let data = try? encoder.encode(sessions) {
+                try? data.write(to: sessionsURL, options: .atomic)
+            }
         }
     }
 
+    private func saveIfNeeded() {
+        guard hasUnsavedChanges else { return }
+        saveData()
+    }
+
     private func startAutoSave() {
         saveTimer = Timer.scheduledTimer(withTimeInterval: saveInterval, repeats: true) { [weak self] _ in
             Task { @MainActor in
-                self?.saveData()
+                self?.saveIfNeeded()
             }
         }
     }
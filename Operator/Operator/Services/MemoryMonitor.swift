@@ -31,17 +31,4 @@ class MemoryMonitor {
             swapUsedBytes: swap?.used ?? 0
         )
     }
-
-    /// Get detailed memory breakdown for display
-    func getDetailedBreakdown() -> [(label: String, bytes: UInt64, color: String)] {
-        guard let stats = MachHelpers.getMemoryStats() else { return [] }
-
-        return [
-            ("Active", stats.active, "blue"),
-            ("Inactive", stats.inactive, "cyan"),
-            ("Wired", stats.wired, "orange"),
-            ("Compressed", stats.compressed, "purple"),
-            ("Free", stats.free, "green")
-        ]
-    }
 }
@@ -12,7 +12,14 @@ import Darwin
 class NetworkMonitor {
     // Previous values for rate calculation
     private var previousBytes: [String: (sent: UInt64, received: UInt64)] = [:]
-    private var previousTimestamp: Date?
+    private var previousTimestamp: TimeInterval?
+
+    // Exponential moving average of the totals, so graphs aren't dominated by
+    // per-interval bursts
+    private static let smoothingFactor = 0.3
+    private var smoothedUploadSpeed: Double = 0
+    private var smoothedDownloadSpeed: Double = 0
+    private var hasSmoothedSpeeds = false
 
     // NWPathMonitor for connection status
     private var pathMonitor: NWPathMonitor?
@@ -21,7 +28,7 @@ class NetworkMonitor {
 
     func getMetrics() -> NetworkMetrics {
         let currentStats = NetworkHelpers.getInterfaceStats()
-        let currentTime = Date()
+        let currentTime = MachHelpers.monotonicTime()
 
         var totalBytesSent: UInt64 = 0
         var totalBytesReceived: UInt64 = 0
@@ -29,7 +36,8 @@ class NetworkMonitor {
         var totalDownloadSpeed: Double = 0
         var interfaces: [NetworkInterfaceInfo] = []
 
-        let timeDelta = previousTimestamp.map { currentTime.timeIntervalSince($0) } ?? 1.0
+        let hasBaseline = previousTimestamp != nil
+        let timeDelta = previousTimestamp.map { currentTime - $0 } ?? 1.0
 
         for (name, stats) in currentStats {
             // Skip loopback and system interfaces for total calculation
@@ -79,6 +87,17 @@ class NetworkMonitor {
 
         previousTimestamp = currentTime
 
+        if hasSmoothedSpeeds {
+            let alpha = Self.smoothingFactor
+            smoothedUploadSpeed += alpha * (totalUploadSpeed - smoothedUploadSpeed)
+            smoothedDownloadSpeed += alpha * (totalDownloadSpeed - smoothedDownloadSpeed)
+        } else if hasBaseline {
+            // Seed from the first real rate so the graph doesn't ramp up from zero
+            smoothedUploadSpeed = totalUploadSpeed
+            smoothedDownloadSpeed = totalDownloadSpeed
+            hasSmoothedSpeeds = true
+        }
+
         // Sort interfaces: en0 first, then by name
         interfaces.sort { lhs, rhs in
             if lhs.name == "en0" { return true }
@@ -91,6 +110,8 @@ class NetworkMonitor {
             bytesReceived: totalBytesReceived,
             uploadSpeed: totalUploadSpeed,
             downloadSpeed: totalDownloadSpeed,
+            smoothedUploadSpeed: smoothedUploadSpeed,
+            smoothedDownloadSpeed: smoothedDownloadSpeed,
             interfaces: interfaces,
             isConnected: isConnected,
             connectionType: connectionType
@@ -10,10 +10,39 @@ import Darwin
 
 class ProcessMonitor {
     private var previousCPUTimes: [Int32: (user: UInt64, system: UInt64)] = [:]
-    private var previousTimestamp: Date?
+    private var previousTimestamp: TimeInterval?
+
+    /// PIDs from the most recent scan, reused when pruning per-PID state
+    private var listedPIDs: ArraySlice<pid_t> = []
+
+    /// Executable path and name per PID, reused while the process is unchanged
+    private var identityCache: [Int32: ProcessIdentity] = [:]
+
+    /// Account names per UID; a handful of users own every process
+    private var usernameCache: [uid_t: String] = [:]
+
+    private struct ProcessIdentity {
+        let startTime: UInt64
+        let command: String
+        let path: String
+        let name: String
+    }
+
+    /// Raw per-process numbers gathered for every PID; only the top N are
+    /// turned into ProcessInfoModel (with username lookup and state mapping)
+    private struct ProcessSample {
+        let pid: pid_t
+        let identity: ProcessIdentity
+        let cpuUsage: Double
+        let memoryPercent: Double
+        let residentSize: UInt64
+        let uid: uid_t
+        let threads: Int32
+        let status: UInt32
+    }
 
     func getTopProcesses(count: Int = 20, sortBy: ProcessSortKey = .cpu) -> [ProcessInfoModel] {
-        var processes: [ProcessInfoModel] = []
+        var samples: [ProcessSample] = []
 
         // Get all PIDs
         let bufferSize = proc_listpids(UInt32(PROC_ALL_PIDS), 0, nil, 0)
@@ -25,8 +54,10 @@ class ProcessMonitor {
         guard actualSize > 0 else { return [] }
 
         let pidCount = Int(actualSize) / MemoryLayout<pid_t>.size
-        let currentTime = Date()
-        let timeDelta = previousTimestamp.map { currentTime.timeIntervalSince($0) } ?? 1.0
+        listedPIDs = pids.prefix(pidCount)
+        samples.reserveCapacity(pidCount)
+        let currentTime = MachHelpers.monotonicTime()
+        let timeDelta = previousTimestamp.map { currentTime - $0 } ?? 1.0
 
         let totalMemory = Double(Sysctl.physicalMemory)
 
@@ -41,14 +72,11 @@ class ProcessMonitor {
             let result = proc_pidinfo(pid, PROC_PIDTASKALLINFO, 0, &taskInfo, Int32(taskInfoSize))
             guard result == taskInfoSize else { continue }
 
-            // Get process name - use MAXPATHLEN * 4 as the buffer size
-            var pathBuffer = [CChar](repeating: 0, count: 4096)
-            proc_pidpath(pid, &pathBuffer, UInt32(pathBuffer.count))
-            let path = String(cString: pathBuffer)
-            let name = (path as NSString).lastPathComponent
+            // Get process path and name (cached, so steady state is one proc_pidinfo per process)
+            let identity = getIdentity(for: pid, bsdInfo: taskInfo.pbsd)
 
             // Skip if no name
-            guard !name.isEmpty else { continue }
+            guard !identity.name.isEmpty else { continue }
 
             // Calculate CPU usage from task times
             let userTime = UInt64(taskInfo.ptinfo.pti_total_user)
@@ -70,53 +98,133 @@ class ProcessMonitor {
             let residentSize = UInt64(taskInfo.ptinfo.pti_resident_size)
             let memoryPercent = totalMemory > 0 ? (Double(residentSize) / totalMemory) * 100 : 0
 
-            // Get username (simplified - would need proper UID lookup for full username)
-            let uid = taskInfo.pbsd.pbi_uid
-            let username = getUsername(for: uid)
-
-            // Process state
-            let state = getProcessState(from: taskInfo.pbsd.pbi_status)
-
-            processes.append(ProcessInfoModel(
-                id: pid,
-                name: name,
+            samples.append(ProcessSample(
+                pid: pid,
+                identity: identity,
                 cpuUsage: cpuUsage,
-                memoryUsage: memoryPercent,
-                memoryBytes: residentSize,
-                user: username,
+                memoryPercent: memoryPercent,
+                residentSize: residentSize,
+                uid: taskInfo.pbsd.pbi_uid,
                 threads: taskInfo.ptinfo.pti_threadnum,
-                state: state,
-                path: path.isEmpty ? nil : path,
-                bundleIdentifier: nil
+                status: taskInfo.pbsd.pbi_status
             ))
         }
 
         previousTimestamp = currentTime
 
-        // Sort processes
+        // Select the top N without sorting the whole process list
+        let top: [ProcessSample]
         switch sortBy {
         case .cpu:
-            processes.sort { $0.cpuUsage > $1.cpuUsage }
+            top = selectTop(count, from: samples) { $0.cpuUsage > $1.cpuUsage }
         case .memory:
-            processes.sort { $0.memoryUsage > $1.memoryUsage }
+            top = selectTop(count, from: samples) { $0.memoryPercent > $1.memoryPercent }
         case .name:
-            processes.sort { $0.name.lowercased() < $1.name.lowercased() }
+            top = selectTop(count, from: samples) { $0.identity.name.lowercased() < $1.identity.name.lowercased() }
         case .pid:
-            processes.sort { $0.id < $1.id }
+            top = selectTop(count, from: samples) { $0.pid < $1.pid }
         }
 
-        // Return top N
-        return Array(processes.prefix(count))
+        // Build display models only for the processes that will be shown
+        return top.map { sample in
+            ProcessInfoModel(
+                id: sample.pid,
+                name: sample.identity.name,
+                cpuUsage: sample.cpuUsage,
+                memoryUsage: sample.memoryPercent,
+                memoryBytes: sample.residentSize,
+                user: getUsername(for: sample.uid),
+                threads: sample.threads,
+                state: getProcessState(from: sample.status),
+                path: sample.identity.path.isEmpty ? nil : sample.identity.path,
+                bundleIdentifier: nil
+            )
+        }
     }
 
     // MARK: - Private Methods
 
-    private func getUsername(for uid: UInt32) -> String {
-        // Get username from UID
-        if let passwd = getpwuid(uid) {
-            return String(cString: passwd.pointee.pw_name)
+    private func getIdentity(for pid: pid_t, bsdInfo: proc_bsdinfo) -> ProcessIdentity {
+        let startTime = bsdInfo.pbi_start_tvsec * 1_000_000 + bsdInfo.pbi_start_tvusec
+        let command = withUnsafeBytes(of: bsdInfo.pbi_comm) { buffer in
+            String(decoding: buffer.prefix { $0 != 0 }, as: UTF8.self)
+        }
+
+        // Start time catches PID reuse, the command name catches exec
+        if let cached = identityCache[pid], cached.startTime == startTime, cached.command == command {
+            return cached
+        }
+
+        // Get process name - use MAXPATHLEN * 4 as the buffer size
+        var pathBuffer = [UInt8](repeating: 0, count: 4096)
+        let pathLength = Int(max(proc_pidpath(pid, &pathBuffer, UInt32(pathBuffer.count)), 0))
+
+        // Split off the last component on the raw bytes rather than bridging through NSString
+        let pathBytes = pathBuffer[..<pathLength]
+        let nameStart = pathBytes.lastIndex(of: UInt8(ascii: "/")).map { $0 + 1 } ?? 0
+        let path = String(decoding: pathBytes, as: UTF8.self)
+        let name = String(decoding: pathBytes[nameStart...], as: UTF8.self)
+
+        let identity = ProcessIdentity(startTime: startTime, command: command, path: path, name: name)
+        // Don't cache a failed lookup, or the process stays hidden until it exits
+        if pathLength > 0 {
+            identityCache[pid] = identity
         }
-        return String(uid)
+        return identity
+    }
+
+    /// Keeps a bounded, ordered buffer of the best `count` samples.
+    /// O(n log k) comparisons, and most candidates are rejected against the last entry.
+    private func selectTop(
+        _ count: Int,
+        from samples: [ProcessSample],
+        by areInIncreasingOrder: (ProcessSample, ProcessSample) -> Bool
+    ) -> [ProcessSample] {
+        guard count > 0 else { return [] }
+
+        var top: [ProcessSample] = []
+        top.reserveCapacity(count + 1)
+
+        for sample in samples {
+            if top.count == count, let last = top.last, !areInIncreasingOrder(sample, last) {
+                continue
+            }
+
+            // Binary search for the insertion point, after any equal entries
+            var low = 0
+            var high = top.count
+            while low < high {
+                let mid = (low + high) / 2
+                if areInIncreasingOrder(sample, top[mid]) {
+                    high = mid
+                } else {
+                    low = mid + 1
+                }
+            }
+
+            top.insert(sample, at: low)
+            if top.count > count {
+                top.removeLast()
+            }
+        }
+
+        return top
+    }
+
+    private func getUsername(for uid: uid_t) -> String {
+        if let cached = usernameCache[uid] {
+            return cached
+        }
+
+        // Get username from UID; a failed lookup falls back to the number
+        // uncached, so new users or a Directory Services hiccup resolve later
+        guard let passwd = getpwuid(uid) else {
+            return String(uid)
+        }
+
+        let username = String(cString: passwd.pointee.pw_name)
+        usernameCache[uid] = username
+        return username
     }
 
     private func getProcessState(from status: UInt32) -> ProcessState {
@@ -137,13 +245,12 @@ class ProcessMonitor {
 
     /// Clean up stale process entries
     func cleanupStaleProcesses() {
-        // Remove entries for processes that no longer exist
-        var pids = [pid_t](repeating: 0, count: 4096)
-        let size = proc_listpids(UInt32(PROC_ALL_PIDS), 0, &pids, Int32(pids.count * MemoryLayout<pid_t>.size))
+        // Remove entries for processes that no longer exist, using the PID list
+        // from the scan that just ran rather than listing all PIDs again
+        guard !listedPIDs.isEmpty else { return }
 
-        if size > 0 {
-            let activePids = Set(pids.prefix(Int(size) / MemoryLayout<pid_t>.size))
-            previousCPUTimes = previousCPUTimes.filter { activePids.contains($0.key) }
-        }
+        let activePids = Set(listedPIDs)
+        previousCPUTimes = previousCPUTimes.filter { activePids.contains($0.key) }
+        identityCache = identityCache.filter { activePids.contains($0.key) }
     }
 }
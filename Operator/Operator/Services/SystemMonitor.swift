@@ -7,7 +7,6 @@
 
 import Foundation
 import Combine
-import Network
 
 @MainActor
 class SystemMonitor: ObservableObject {
@@ -36,10 +35,16 @@ class SystemMonitor: ObservableObject {
 
     private var timer: Timer?
     private let collector = MetricsCollector()
-    private var lastProcessRefresh: Date = .distantPast
+    private var lastProcessRefresh: TimeInterval = -.infinity
     private let processRefreshInterval: TimeInterval = 2.0
-    private var lastBatteryRefresh: Date = .distantPast
+    private let backgroundProcessRefreshInterval: TimeInterval = 30.0
+    private var processListViewerCount = 0
+    private var lastBatteryRefresh: TimeInterval = -.infinity
     private let batteryRefreshInterval: TimeInterval = 5.0
+    private let backgroundBatteryRefreshInterval: TimeInterval = 60.0
+    private var batteryDetailViewerCount = 0
+    private var isRefreshing = false
+    private var cancellables = Set<AnyCancellable>()
 
     // MARK: - Initialization
 
@@ -47,6 +52,15 @@ class SystemMonitor: ObservableObject {
         loadSystemInfo()
         startMonitoring()
         HistoryStore.shared.startSession()
+
+        // Handle toolbar refresh requests here so views don't need to observe us just to forward them
+        NotificationCenter.default.publisher(for: NSNotification.Name("ForceRefresh"))
+            .sink { [weak self] _ in
+                Task { @MainActor in
+                    self?.forceRefresh()
+                }
+            }
+            .store(in: &cancellables)
     }
 
     deinit {
@@ -83,6 +97,26 @@ class SystemMonitor: ObservableObject {
         refreshMetrics()
     }
 
+    /// Battery and thermal data is only shown on the Battery tab, so it is
+    /// sampled at the full rate only while that tab is on screen in some window
+    func setBatteryDetailVisible(_ visible: Bool) {
+        batteryDetailViewerCount = max(batteryDetailViewerCount + (visible ? 1 : -1), 0)
+        if visible && batteryDetailViewerCount == 1 {
+            // Pick up fresh values on the next tick rather than waiting out the slow interval
+            lastBatteryRefresh = -.infinity
+        }
+    }
+
+    /// The process list is shown by the menu bar, the overview and the
+    /// Processes tab; while none of them is on screen and no process alert
+    /// is enabled, the process table is only rescanned occasionally
+    func setProcessListVisible(_ visible: Bool) {
+        processListViewerCount = max(processListViewerCount + (visible ? 1 : -1), 0)
+        if visible && processListViewerCount == 1 {
+            lastProcessRefresh = -.infinity
+        }
+    }
+
     // MARK: - Private Methods
 
     private func restartTimer() {
@@ -99,16 +133,13 @@ class SystemMonitor: ObservableObject {
     }
 
     private func refreshMetrics() {
+        // Coalesce overlapping requests (forced refreshes, or a tick that fires
+        // while a slow collection is still running) into the one in flight
+        guard !isRefreshing else { return }
+        isRefreshing = true
+
         let includeProcesses = shouldRefreshProcesses
         let includeBattery = shouldRefreshBattery
-        let historyLimit = historyLength
-        let currentCPUHistory = cpuMetrics.history
-        let currentMemoryHistory = memoryMetrics.history
-        let currentUploadHistory = networkMetrics.uploadHistory
-        let currentDownloadHistory = networkMetrics.downloadHistory
-        let currentBatteryHistory = batteryMetrics.history
-        let currentCPUTempHistory = thermalMetrics.cpuHistory
-        let currentGPUTempHistory = thermalMetrics.gpuHistory
         let collector = self.collector
 
         Task.detached { [weak self, collector] in
@@ -120,21 +151,26 @@ class SystemMonitor: ObservableObject {
 
             await MainActor.run {
                 guard let self else { return }
+                self.isRefreshing = false
+
+                // Extend the histories as they stand now rather than copies captured
+                // before the collection, so every sample lands on the latest state
+                let historyLimit = self.historyLength
 
                 // CPU
                 var cpu = snapshot.cpu
-                cpu.history = Self.updateHistory(currentCPUHistory, with: cpu.totalUsage, maxCount: historyLimit)
+                cpu.history = Self.updateHistory(self.cpuMetrics.history, with: cpu.totalUsage, maxCount: historyLimit)
                 self.cpuMetrics = cpu
 
                 // Memory
                 var memory = snapshot.memory
-                memory.history = Self.updateHistory(currentMemoryHistory, with: memory.usagePercent, maxCount: historyLimit)
+                memory.history = Self.updateHistory(self.memoryMetrics.history, with: memory.usagePercent, maxCount: historyLimit)
                 self.memoryMetrics = memory
 
                 // Network
                 var network = snapshot.network
-                network.uploadHistory = Self.updateHistory(currentUploadHistory, with: network.uploadSpeed, maxCount: historyLimit)
-                network.downloadHistory = Self.updateHistory(currentDownloadHistory, with: network.downloadSpeed, maxCount: historyLimit)
+                network.uploadHistory = Self.updateHistory(self.networkMetrics.uploadHistory, with: network.smoothedUploadSpeed, maxCount: historyLimit)
+                network.downloadHistory = Self.updateHistory(self.networkMetrics.downloadHistory, with: network.smoothedDownloadSpeed, maxCount: historyLimit)
                 self.networkMetrics = network
 
                 // Disk
@@ -146,21 +182,21 @@ class SystemMonitor: ObservableObject {
                 // Processes (throttled)
                 if includeProcesses, let processList = snapshot.processes {
                     self.processes = processList
-                    self.lastProcessRefresh = Date()
+                    self.lastProcessRefresh = MachHelpers.monotonicTime()
                 }
 
                 // Battery & Thermal (throttled)
                 if includeBattery {
                     var battery = snapshot.battery
-                    battery.history = Self.updateHistory(currentBatteryHistory, with: battery.chargePercent, maxCount: historyLimit)
+                    battery.history = Self.updateHistory(self.batteryMetrics.history, with: battery.chargePercent, maxCount: historyLimit)
                     self.batteryMetrics = battery
 
                     var thermal = snapshot.thermal
-                    thermal.cpuHistory = Self.updateHistory(currentCPUTempHistory, with: thermal.cpuTemperature, maxCount: historyLimit)
-                    thermal.gpuHistory = Self.updateHistory(currentGPUTempHistory, with: thermal.gpuTemperature, maxCount: historyLimit)
+                    thermal.cpuHistory = Self.updateHistory(self.thermalMetrics.cpuHistory, with: thermal.cpuTemperature, maxCount: historyLimit)
+                    thermal.gpuHistory = Self.updateHistory(self.thermalMetrics.gpuHistory, with: thermal.gpuTemperature, maxCount: historyLimit)
                     self.thermalMetrics = thermal
 
-                    self.lastBatteryRefresh = Date()
+                    self.lastBatteryRefresh = MachHelpers.monotonicTime()
                 }
 
                 // Record to history store
@@ -195,19 +231,20 @@ class SystemMonitor: ObservableObject {
     }
 
     private var shouldRefreshBattery: Bool {
-        Date().timeIntervalSince(lastBatteryRefresh) >= batteryRefreshInterval
+        let interval = batteryDetailViewerCount > 0 ? batteryRefreshInterval : backgroundBatteryRefreshInterval
+        return MachHelpers.monotonicTime() - lastBatteryRefresh >= interval
     }
 
     private var shouldRefreshProcesses: Bool {
-        Date().timeIntervalSince(lastProcessRefresh) >= processRefreshInterval
+        // Process alerts need samples as fresh as the on-screen list gets
+        let needsFullRate = processListViewerCount > 0 || AlertManager.shared.hasEnabledProcessRules
+        let interval = needsFullRate ? processRefreshInterval : backgroundProcessRefreshInterval
+        return MachHelpers.monotonicTime() - lastProcessRefresh >= interval
     }
 
-    private static func updateHistory(_ history: [Double], with value: Double, maxCount: Int) -> [Double] {
+    private static func updateHistory(_ history: HistoryBuffer, with value: Double, maxCount: Int) -> HistoryBuffer {
         var newHistory = history
-        newHistory.append(value)
-        if newHistory.count > maxCount {
-            newHistory.removeFirst(newHistory.count - maxCount)
-        }
+        newHistory.append(value, maxCount: maxCount)
         return newHistory
     }
 }
@@ -230,31 +267,37 @@ private actor MetricsCollector {
         networkMonitor.stopPathMonitor()
     }
 
+    /// SystemMonitor's `isRefreshing` guard keeps this to one call at a time,
+    /// so the monitors are never sampled from two collections at once
     func collect(includeProcesses: Bool, includeBattery: Bool, processCount: Int) async -> MetricsSnapshot {
-        let cpu = cpuMonitor.getMetrics()
-        let memory = memoryMonitor.getMetrics()
-        let network = networkMonitor.getMetrics()
-        let disk = diskMonitor.getMetrics()
-
-        let processes: [ProcessInfoModel]? = includeProcesses
-        ? processMonitor.getTopProcesses(count: processCount)
-        : nil
-
-        if includeProcesses {
+        // The monitors are independent and each is only touched by a single child
+        // task, so run them concurrently; the process scan is the long pole
+        let cpuMonitor = self.cpuMonitor
+        let memoryMonitor = self.memoryMonitor
+        let networkMonitor = self.networkMonitor
+        let diskMonitor = self.diskMonitor
+        let processMonitor = self.processMonitor
+        let batteryMonitor = self.batteryMonitor
+
+        async let cpu = cpuMonitor.getMetrics()
+        async let memory = memoryMonitor.getMetrics()
+        async let network = networkMonitor.getMetrics()
+        async let disk = diskMonitor.getMetrics()
+
+        async let processes: [ProcessInfoModel]? = {
+            guard includeProcesses else { return nil }
+            let processes = processMonitor.getTopProcesses(count: processCount)
             processMonitor.cleanupStaleProcesses()
-        }
+            return processes
+        }()
 
-        let battery: BatteryMetrics
-        let thermal: ThermalMetrics
-        if includeBattery {
-            battery = batteryMonitor.getMetrics()
-            thermal = batteryMonitor.getThermalMetrics()
-        } else {
-            battery = .empty
-            thermal = .empty
-        }
+        async let power: (battery: BatteryMetrics, thermal: ThermalMetrics) = includeBattery
+        ? (batteryMonitor.getMetrics(), batteryMonitor.getThermalMetrics())
+        : (.empty, .empty)
+
+        let (battery, thermal) = await power
 
-        return MetricsSnapshot(
+        return await MetricsSnapshot(
             cpu: cpu,
             memory: memory,
             network: network,
@@ -8,63 +8,69 @@
 import Foundation
 
 enum ByteFormatter {
+    private static let byteUnits = ["B", "KB", "MB", "GB", "TB", "PB"]
+    private static let speedUnits = ["B/s", "KB/s", "MB/s", "GB/s"]
+    private static let compactSpeedUnits = ["B", "K", "M", "G"]
+
+    /// Byte counts stay raw in the models; this is the one place they become gigabytes
+    private static let bytesPerGigabyte: Double = 1_073_741_824
+
     /// Format bytes to human-readable string (KB, MB, GB, etc.)
     static func formatBytes(_ bytes: UInt64) -> String {
-        let units = ["B", "KB", "MB", "GB", "TB", "PB"]
-        var value = Double(bytes)
-        var unitIndex = 0
-
-        while value >= 1024 && unitIndex < units.count - 1 {
-            value /= 1024
-            unitIndex += 1
-        }
+        // Each unit is 10 bits, so the unit index follows from the highest set bit
+        let unitIndex = bytes == 0 ? 0 : min((63 - bytes.leadingZeroBitCount) / 10, byteUnits.count - 1)
+        let value = Double(bytes) / Double(UInt64(1) << (10 * unitIndex))
 
         if unitIndex == 0 {
-            return String(format: "%.0f %@", value, units[unitIndex])
+            return String(format: "%.0f %@", value, byteUnits[unitIndex])
         } else if value < 10 {
-            return String(format: "%.2f %@", value, units[unitIndex])
+            return String(format: "%.2f %@", value, byteUnits[unitIndex])
         } else if value < 100 {
-            return String(format: "%.1f %@", value, units[unitIndex])
+            return String(format: "%.1f %@", value, byteUnits[unitIndex])
         } else {
-            return String(format: "%.0f %@", value, units[unitIndex])
+            return String(format: "%.0f %@", value, byteUnits[unitIndex])
         }
     }
 
+    /// Format bytes as gigabytes, e.g. "12.3 GB"
+    static func formatGigabytes(_ bytes: UInt64, decimals: Int = 1) -> String {
+        String(format: "%.\(decimals)f GB", Double(bytes) / bytesPerGigabyte)
+    }
+
+    /// Format a used/total pair as "12.3 / 16.0 GB"
+    static func formatGigabytes(used: UInt64, total: UInt64) -> String {
+        String(format: "%.1f / %.1f GB", Double(used) / bytesPerGigabyte, Double(total) / bytesPerGigabyte)
+    }
+
     /// Format bytes per second to human-readable speed
     static func formatSpeed(_ bytesPerSecond: Double) -> String {
-        let units = ["B/s", "KB/s", "MB/s", "GB/s"]
-        var value = bytesPerSecond
-        var unitIndex = 0
-
-        while value >= 1024 && unitIndex < units.count - 1 {
-            value /= 1024
-            unitIndex += 1
-        }
+        let (value, unitIndex) = scale(bytesPerSecond, unitCount: speedUnits.count)
 
         if value < 10 {
-            return String(format: "%.1f %@", value, units[unitIndex])
+            return String(format: "%.1f %@", value, speedUnits[unitIndex])
         } else {
-            return String(format: "%.0f %@", value, units[unitIndex])
+            return String(format: "%.0f %@", value, speedUnits[unitIndex])
         }
     }
 
     /// Format bytes per second to compact string for menu bar
     static func formatSpeedCompact(_ bytesPerSecond: Double) -> String {
-        let units = ["B", "K", "M", "G"]
-        var value = bytesPerSecond
-        var unitIndex = 0
-
-        while value >= 1024 && unitIndex < units.count - 1 {
-            value /= 1024
-            unitIndex += 1
-        }
+        let (value, unitIndex) = scale(bytesPerSecond, unitCount: compactSpeedUnits.count)
 
         if value < 10 {
-            return String(format: "%.1f%@", value, units[unitIndex])
+            return String(format: "%.1f%@", value, compactSpeedUnits[unitIndex])
         } else {
-            return String(format: "%.0f%@", value, units[unitIndex])
+            return String(format: "%.0f%@", value, compactSpeedUnits[unitIndex])
         }
     }
+
+    /// Scale a byte value down by powers of 1024, using the binary exponent to pick the unit
+    private static func scale(_ value: Double, unitCount: Int) -> (value: Double, unitIndex: Int) {
+        guard value >= 1024 else { return (value, 0) }
+
+        let unitIndex = min(Int(value.exponent) / 10, unitCount - 1)
+        return (value / Double(UInt64(1) << (10 * unitIndex)), unitIndex)
+    }
 }
 
 enum PercentFormatter {
@@ -73,9 +79,17 @@ enum PercentFormatter {
         String(format: "%.\(decimals)f%%", value)
     }
 
+    /// "0%" through "100%", built once; gauges and bars format these every refresh
+    private static let wholePercentStrings: [String] = (0...100).map { "\($0)%" }
+
     /// Format percentage as integer
     static func formatInt(_ value: Double) -> String {
-        String(format: "%.0f%%", value)
+        // %.0f rounds half to even, so match it before indexing the table
+        let rounded = value.rounded(.toNearestOrEven)
+        guard rounded >= 0, rounded <= 100 else {
+            return String(format: "%.0f%%", value)
+        }
+        return wholePercentStrings[Int(rounded)]
     }
 }
 
@@ -99,11 +113,15 @@ enum TimeFormatter {
         let hours = (Int(seconds) % 86400) / 3600
         let minutes = (Int(seconds) % 3600) / 60
 
-        var components: [String] = []
-        if days > 0 { components.append("\(days)d") }
-        if hours > 0 { components.append("\(hours)h") }
-        if minutes > 0 || components.isEmpty { components.append("\(minutes)m") }
-
-        return components.joined(separator: " ")
+        // Shown every refresh, so pick the layout directly instead of joining an array
+        switch (days > 0, hours > 0, minutes > 0) {
+        case (true, true, true): return "\(days)d \(hours)h \(minutes)m"
+        case (true, true, false): return "\(days)d \(hours)h"
+        case (true, false, true): return "\(days)d \(minutes)m"
+        case (true, false, false): return "\(days)d"
+        case (false, true, true): return "\(hours)h \(minutes)m"
+        case (false, true, false): return "\(hours)h"
+        case (false, false, _): return "\(minutes)m"
+        }
     }
 }
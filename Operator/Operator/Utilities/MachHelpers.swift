@@ -21,56 +21,6 @@ enum MachHelpers {
         var total: UInt64 { user + system + idle + nice }
     }
 
-    /// Get CPU usage for all cores
-    static func getCPUUsage() -> (total: Double, perCore: [Double])? {
-        var cpuInfo: processor_info_array_t?
-        var numCPUs: mach_msg_type_number_t = 0
-        var numCPUInfo: mach_msg_type_number_t = 0
-
-        let result = host_processor_info(
-            mach_host_self(),
-            PROCESSOR_CPU_LOAD_INFO,
-            &numCPUs,
-            &cpuInfo,
-            &numCPUInfo
-        )
-
-        guard result == KERN_SUCCESS, let cpuInfo = cpuInfo else {
-            return nil
-        }
-
-        defer {
-            let cpuInfoSize = vm_size_t(numCPUInfo) * vm_size_t(MemoryLayout<integer_t>.size)
-            vm_deallocate(mach_task_self_, vm_address_t(bitPattern: cpuInfo), cpuInfoSize)
-        }
-
-        var coreUsages: [Double] = []
-        var totalUser: UInt64 = 0
-        var totalSystem: UInt64 = 0
-        var totalIdle: UInt64 = 0
-
-        for i in 0..<Int(numCPUs) {
-            let offset = Int(CPU_STATE_MAX) * i
-            let user = UInt64(cpuInfo[offset + Int(CPU_STATE_USER)])
-            let system = UInt64(cpuInfo[offset + Int(CPU_STATE_SYSTEM)])
-            let idle = UInt64(cpuInfo[offset + Int(CPU_STATE_IDLE)])
-            let nice = UInt64(cpuInfo[offset + Int(CPU_STATE_NICE)])
-
-            let total = user + system + idle + nice
-            let usage = total > 0 ? Double(user + system + nice) / Double(total) * 100 : 0
-            coreUsages.append(usage)
-
-            totalUser += user + nice
-            totalSystem += system
-            totalIdle += idle
-        }
-
-        let grandTotal = totalUser + totalSystem + totalIdle
-        let totalUsage = grandTotal > 0 ? Double(totalUser + totalSystem) / Double(grandTotal) * 100 : 0
-
-        return (totalUsage, coreUsages)
-    }
-
     // MARK: - Memory Statistics
 
     /// Get memory statistics using vm_statistics64
@@ -110,6 +60,14 @@ enum MachHelpers {
 
         return (swapUsage.xsu_total, swapUsage.xsu_used)
     }
+
+    // MARK: - Time
+
+    /// Seconds on a monotonic clock that keeps counting through sleep and ignores
+    /// wall-clock changes. Use for rate deltas and throttling, not for display.
+    static func monotonicTime() -> TimeInterval {
+        TimeInterval(clock_gettime_nsec_np(CLOCK_MONOTONIC_RAW)) / 1_000_000_000
+    }
 }
 
 // MARK: - Network Interface Helpers
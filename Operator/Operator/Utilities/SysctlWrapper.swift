@@ -63,33 +63,26 @@ enum Sysctl {
 
     // MARK: - Common System Values
 
+    // Hardware and boot values are fixed for the lifetime of the process, so they
+    // are read once on first access instead of issuing a sysctl on every refresh.
+
     /// Physical CPU core count
-    static var physicalCPUCount: Int32 {
-        int32(for: "hw.physicalcpu") ?? 1
-    }
+    static let physicalCPUCount: Int32 = int32(for: "hw.physicalcpu") ?? 1
 
     /// Logical CPU (thread) count
-    static var logicalCPUCount: Int32 {
-        int32(for: "hw.logicalcpu") ?? 1
-    }
+    static let logicalCPUCount: Int32 = int32(for: "hw.logicalcpu") ?? 1
 
     /// Total physical memory in bytes
-    static var physicalMemory: UInt64 {
-        uint64(for: "hw.memsize") ?? 0
-    }
+    static let physicalMemory: UInt64 = uint64(for: "hw.memsize") ?? 0
 
     /// Machine model identifier (e.g., "MacBookPro18,1")
-    static var machineModel: String {
-        string(for: "hw.model") ?? "Unknown"
-    }
+    static let machineModel: String = string(for: "hw.model") ?? "Unknown"
 
     /// CPU brand string
-    static var cpuBrand: String {
-        string(for: "machdep.cpu.brand_string") ?? "Apple Silicon"
-    }
+    static let cpuBrand: String = string(for: "machdep.cpu.brand_string") ?? "Apple Silicon"
 
     /// System boot time
-    static var bootTime: Date {
+    static let bootTime: Date = {
         var mib: [Int32] = [CTL_KERN, KERN_BOOTTIME]
         var boottime = timeval()
         var size = MemoryLayout<timeval>.size
@@ -99,7 +92,7 @@ enum Sysctl {
         }
 
         return Date(timeIntervalSince1970: TimeInterval(boottime.tv_sec))
-    }
+    }()
 
     /// System uptime in seconds
     static var uptime: TimeInterval {
@@ -107,10 +100,10 @@ enum Sysctl {
     }
 
     /// macOS version string
-    static var osVersion: String {
+    static let osVersion: String = {
         let version = ProcessInfo.processInfo.operatingSystemVersion
         return "\(version.majorVersion).\(version.minorVersion).\(version.patchVersion)"
-    }
+    }()
 
     /// Page size in bytes
     static var pageSize: UInt64 {
@@ -24,15 +24,15 @@ struct GlassPanel<Content: View>: View {
 
     var body: some View {
         VStack(alignment: .leading, spacing: 12) {
-            if let title = title {
+            if title != nil {
                 panelHeader
             }
 
             content
         }
         .padding(14)
-        .background(glassBackground)
-        .overlay(glassBorder)
+        .background(GlassPanelShell.background)
+        .overlay(GlassPanelShell.border)
         .shadow(color: Color.black.opacity(0.18), radius: 14, x: 0, y: 10)
         .shadow(color: Color.black.opacity(0.08), radius: 4, x: 0, y: 2)
     }
@@ -41,13 +41,7 @@ struct GlassPanel<Content: View>: View {
         HStack(spacing: 8) {
             if let icon = icon {
                 Image(systemName: icon)
-                    .foregroundStyle(
-                        LinearGradient(
-                            colors: [Color.accentColor, Color.purple.opacity(0.85)],
-                            startPoint: .topLeading,
-                            endPoint: .bottomTrailing
-                        )
-                    )
+                    .foregroundStyle(GlassPanelShell.iconGradient)
                     .font(.system(size: 14, weight: .semibold))
             }
             Text(title ?? "")
@@ -55,52 +49,58 @@ struct GlassPanel<Content: View>: View {
                 .foregroundColor(.primary)
         }
     }
+}
 
-    private var glassBackground: some View {
-        ZStack {
-            RoundedRectangle(cornerRadius: 14, style: .continuous)
-                .fill(.ultraThinMaterial)
-
-            RoundedRectangle(cornerRadius: 14, style: .continuous)
-                .fill(
-                    LinearGradient(
-                        colors: [
-                            Color.white.opacity(0.12),
-                            Color.white.opacity(0.02)
-                        ],
-                        startPoint: .topLeading,
-                        endPoint: .bottomTrailing
-                    )
-                )
+/// Chrome shared by every panel. Generic types can't hold static stored
+/// properties, so it lives here and is built once rather than per body pass.
+private enum GlassPanelShell {
+    static let iconGradient = LinearGradient(
+        colors: [Color.accentColor, Color.purple.opacity(0.85)],
+        startPoint: .topLeading,
+        endPoint: .bottomTrailing
+    )
 
-            RoundedRectangle(cornerRadius: 14, style: .continuous)
-                .fill(
-                    LinearGradient(
-                        colors: [
-                            Color.accentColor.opacity(0.06),
-                            Color.purple.opacity(0.05)
-                        ],
-                        startPoint: .topTrailing,
-                        endPoint: .bottomLeading
-                    )
-                )
-        }
-    }
+    static let background = ZStack {
+        RoundedRectangle(cornerRadius: 14, style: .continuous)
+            .fill(.ultraThinMaterial)
 
-    private var glassBorder: some View {
         RoundedRectangle(cornerRadius: 14, style: .continuous)
-            .stroke(
+            .fill(
                 LinearGradient(
                     colors: [
-                        Color.white.opacity(0.25),
-                        Color.white.opacity(0.08)
+                        Color.white.opacity(0.12),
+                        Color.white.opacity(0.02)
                     ],
                     startPoint: .topLeading,
                     endPoint: .bottomTrailing
-                ),
-                lineWidth: 1
+                )
+            )
+
+        RoundedRectangle(cornerRadius: 14, style: .continuous)
+            .fill(
+                LinearGradient(
+                    colors: [
+                        Color.accentColor.opacity(0.06),
+                        Color.purple.opacity(0.05)
+                    ],
+                    startPoint: .topTrailing,
+                    endPoint: .bottomLeading
+                )
             )
     }
+
+    static let border = RoundedRectangle(cornerRadius: 14, style: .continuous)
+        .stroke(
+            LinearGradient(
+                colors: [
+                    Color.white.opacity(0.25),
+                    Color.white.opacity(0.08)
+                ],
+                startPoint: .topLeading,
+                endPoint: .bottomTrailing
+            ),
+            lineWidth: 1
+        )
 }
 
 // MARK: - Status Indicator
@@ -9,17 +9,29 @@ import SwiftUI
 import Charts
 
 struct NetworkGraphView: View {
-    let uploadHistory: [Double]
-    let downloadHistory: [Double]
+    let uploadHistory: HistoryBuffer
+    let downloadHistory: HistoryBuffer
+    let uploadSpeed: Double?
+    let downloadSpeed: Double?
     let showLegend: Bool
 
+    private static let areaGradient = LinearGradient(
+        colors: [Color.blue.opacity(0.4), Color.blue.opacity(0.1)],
+        startPoint: .top,
+        endPoint: .bottom
+    )
+
     init(
-        uploadHistory: [Double],
-        downloadHistory: [Double],
+        uploadHistory: HistoryBuffer,
+        downloadHistory: HistoryBuffer,
+        uploadSpeed: Double? = nil,
+        downloadSpeed: Double? = nil,
         showLegend: Bool = true
     ) {
         self.uploadHistory = uploadHistory
         self.downloadHistory = downloadHistory
+        self.uploadSpeed = uploadSpeed
+        self.downloadSpeed = downloadSpeed
         self.showLegend = showLegend
     }
 
@@ -40,13 +52,7 @@ struct NetworkGraphView: View {
                         x: .value("Time", index),
                         y: .value("Speed", value)
                     )
-                    .foregroundStyle(
-                        LinearGradient(
-                            colors: [Color.blue.opacity(0.4), Color.blue.opacity(0.1)],
-                            startPoint: .top,
-                            endPoint: .bottom
-                        )
-                    )
+                    .foregroundStyle(Self.areaGradient)
                     .interpolationMethod(.catmullRom)
                 }
 
@@ -91,17 +97,19 @@ struct NetworkGraphView: View {
     }
 
     private var maxSpeed: Double {
-        let maxUp = uploadHistory.max() ?? 0
-        let maxDown = downloadHistory.max() ?? 0
+        let maxUp = uploadHistory.maximum ?? 0
+        let maxDown = downloadHistory.maximum ?? 0
         return max(max(maxUp, maxDown) * 1.2, 1024)  // At least 1 KB/s
     }
 
+    // The histories hold smoothed rates; prefer the raw ones so the legend
+    // matches the other readouts
     private var currentUpload: String {
-        ByteFormatter.formatSpeed(uploadHistory.last ?? 0)
+        ByteFormatter.formatSpeed(uploadSpeed ?? uploadHistory.last ?? 0)
     }
 
     private var currentDownload: String {
-        ByteFormatter.formatSpeed(downloadHistory.last ?? 0)
+        ByteFormatter.formatSpeed(downloadSpeed ?? downloadHistory.last ?? 0)
     }
 }
 
@@ -131,11 +139,18 @@ struct LegendItem: View {
 struct CPUCoreGraphView: View {
     let coreUsages: [Double]
 
+    /// Axis labels built once for the machine's cores instead of per bar per refresh
+    private static let coreLabels: [String] = (0..<Int(Sysctl.logicalCPUCount)).map { "Core \($0)" }
+
+    private static func coreLabel(_ index: Int) -> String {
+        index < coreLabels.count ? coreLabels[index] : "Core \(index)"
+    }
+
     var body: some View {
         Chart {
             ForEach(Array(coreUsages.enumerated()), id: \.offset) { index, usage in
                 BarMark(
-                    x: .value("Core", "Core \(index)"),
+                    x: .value("Core", Self.coreLabel(index)),
                     y: .value("Usage", usage)
                 )
                 .foregroundStyle(StatusColor.from(percentage: usage).swiftUIColor.gradient)
@@ -163,8 +178,8 @@ struct CPUCoreGraphView: View {
 #Preview {
     VStack {
         NetworkGraphView(
-            uploadHistory: (0..<60).map { _ in Double.random(in: 0...500_000) },
-            downloadHistory: (0..<60).map { _ in Double.random(in: 0...2_000_000) }
+            uploadHistory: HistoryBuffer((0..<60).map { _ in Double.random(in: 0...500_000) }),
+            downloadHistory: HistoryBuffer((0..<60).map { _ in Double.random(in: 0...2_000_000) })
         )
         .frame(height: 200)
 
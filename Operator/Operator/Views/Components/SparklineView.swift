@@ -6,15 +6,17 @@
 //
 
 import SwiftUI
-import Charts
 
-struct SparklineView: View {
-    let data: [Double]
+/// Equatable so call sites can use `.equatable()` and skip re-rendering
+/// when the history and color haven't changed. The history's identity and
+/// version stand in for comparing the samples.
+struct SparklineView: View, Equatable {
+    let data: HistoryBuffer
     let color: Color
     let showArea: Bool
 
     init(
-        data: [Double],
+        data: HistoryBuffer,
         color: Color = .accentColor,
         showArea: Bool = true
     ) {
@@ -28,56 +30,48 @@ struct SparklineView: View {
             Rectangle()
                 .fill(Color.clear)
         } else {
-            Chart {
-                ForEach(Array(data.enumerated()), id: \.offset) { index, value in
-                    if showArea {
-                        AreaMark(
-                            x: .value("Time", index),
-                            y: .value("Value", value)
-                        )
-                        .foregroundStyle(
+            ZStack {
+                if showArea {
+                    SparklineShape(data: data, maxValue: maxValue, closed: true)
+                        .fill(
                             LinearGradient(
                                 colors: [color.opacity(0.3), color.opacity(0.05)],
                                 startPoint: .top,
                                 endPoint: .bottom
                             )
                         )
-                    }
-
-                    LineMark(
-                        x: .value("Time", index),
-                        y: .value("Value", value)
-                    )
-                    .foregroundStyle(color)
-                    .lineStyle(StrokeStyle(lineWidth: 1.5))
                 }
+
+                SparklineShape(data: data, maxValue: maxValue)
+                    .stroke(color, style: StrokeStyle(lineWidth: 1.5, lineJoin: .round))
             }
-            .chartXAxis(.hidden)
-            .chartYAxis(.hidden)
-            .chartYScale(domain: 0...maxValue)
         }
     }
 
     private var maxValue: Double {
-        max(data.max() ?? 100, 10) * 1.1
+        max(data.maximum ?? 100, 10) * 1.1
+    }
+
+    static func == (lhs: SparklineView, rhs: SparklineView) -> Bool {
+        lhs.data.isUnchanged(from: rhs.data)
+            && lhs.color == rhs.color
+            && lhs.showArea == rhs.showArea
     }
 }
 
 // MARK: - Network Speed Sparkline
 
-struct NetworkSparklineView: View {
-    let uploadData: [Double]
-    let downloadData: [Double]
+struct NetworkSparklineView: View, Equatable {
+    let uploadData: HistoryBuffer
+    let downloadData: HistoryBuffer
 
     var body: some View {
-        Chart {
+        let maxValue = self.maxValue
+
+        ZStack {
             // Download (below x-axis conceptually, but we show both positive)
-            ForEach(Array(downloadData.enumerated()), id: \.offset) { index, value in
-                AreaMark(
-                    x: .value("Time", index),
-                    y: .value("Download", value)
-                )
-                .foregroundStyle(
+            SparklineShape(data: downloadData, maxValue: maxValue, closed: true)
+                .fill(
                     LinearGradient(
                         colors: [Color.blue.opacity(0.3), Color.blue.opacity(0.05)],
                         startPoint: .top,
@@ -85,34 +79,77 @@ struct NetworkSparklineView: View {
                     )
                 )
 
-                LineMark(
-                    x: .value("Time", index),
-                    y: .value("Download", value)
-                )
-                .foregroundStyle(Color.blue)
-                .lineStyle(StrokeStyle(lineWidth: 1.5))
-            }
+            SparklineShape(data: downloadData, maxValue: maxValue)
+                .stroke(Color.blue, style: StrokeStyle(lineWidth: 1.5, lineJoin: .round))
 
             // Upload
-            ForEach(Array(uploadData.enumerated()), id: \.offset) { index, value in
-                LineMark(
-                    x: .value("Time", index),
-                    y: .value("Upload", value)
-                )
-                .foregroundStyle(Color.green)
-                .lineStyle(StrokeStyle(lineWidth: 1.5, dash: [4, 2]))
-            }
+            SparklineShape(data: uploadData, maxValue: maxValue)
+                .stroke(Color.green, style: StrokeStyle(lineWidth: 1.5, lineJoin: .round, dash: [4, 2]))
         }
-        .chartXAxis(.hidden)
-        .chartYAxis(.hidden)
-        .chartYScale(domain: 0...maxValue)
     }
 
     private var maxValue: Double {
-        let maxUpload = uploadData.max() ?? 0
-        let maxDownload = downloadData.max() ?? 0
+        let maxUpload = uploadData.maximum ?? 0
+        let maxDownload = downloadData.maximum ?? 0
         return max(max(maxUpload, maxDownload), 1024) * 1.1
     }
+
+    static func == (lhs: NetworkSparklineView, rhs: NetworkSparklineView) -> Bool {
+        lhs.uploadData.isUnchanged(from: rhs.uploadData)
+            && lhs.downloadData.isUnchanged(from: rhs.downloadData)
+    }
+}
+
+// MARK: - Sparkline Shape
+
+/// Lightweight line path for small trend graphs.
+///
+/// Sparklines are redrawn on every refresh in the overview and menu bar, so they
+/// build a single path in one pass rather than going through Swift Charts marks.
+struct SparklineShape: Shape {
+    let data: HistoryBuffer
+    let maxValue: Double
+    var closed: Bool = false
+
+    func path(in rect: CGRect) -> Path {
+        var path = Path()
+        guard !data.isEmpty, maxValue > 0 else { return path }
+
+        var points = Self.points(for: data, maxValue: maxValue, in: rect)
+
+        // A single sample is drawn as a flat line across the full width
+        if points.count == 1 {
+            points.append(CGPoint(x: rect.maxX, y: points[0].y))
+        }
+
+        path.addLines(points)
+
+        if closed, let last = points.last {
+            path.addLine(to: CGPoint(x: last.x, y: rect.maxY))
+            path.addLine(to: CGPoint(x: rect.minX, y: rect.maxY))
+            path.closeSubpath()
+        }
+
+        return path
+    }
+
+    /// Map samples to view coordinates in one flat loop, writing straight
+    /// into a preallocated buffer so the path is built with a single call
+    private static func points(for data: HistoryBuffer, maxValue: Double, in rect: CGRect) -> [CGPoint] {
+        let count = data.count
+        let step = count > 1 ? Double(rect.width) / Double(count - 1) : 0
+        let yScale = Double(rect.height) / maxValue
+        let minX = Double(rect.minX)
+        let maxY = Double(rect.maxY)
+
+        return [CGPoint](unsafeUninitializedCapacity: count + 1) { buffer, initializedCount in
+            for index in 0..<count {
+                let value = Swift.min(Swift.max(data[index], 0), maxValue)
+                buffer[index] = CGPoint(x: minX + Double(index) * step, y: maxY - value * yScale)
+            }
+            initializedCount = count
+        }
+    }
 }
 
 // MARK: - Preview
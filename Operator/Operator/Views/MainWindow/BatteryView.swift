@@ -49,6 +49,12 @@ struct BatteryView: View {
             }
             .padding()
         }
+        .onAppear {
+            systemMonitor.setBatteryDetailVisible(true)
+        }
+        .onDisappear {
+            systemMonitor.setBatteryDetailVisible(false)
+        }
     }
 }
 
@@ -103,6 +109,7 @@ struct BatteryStatusPanel: View {
                         data: metrics.history,
                         color: metrics.statusColor.swiftUIColor
                     )
+                    .equatable()
                     .frame(width: 100, height: 50)
                 }
             }
@@ -235,7 +242,7 @@ struct ThermalStatusPanel: View {
 struct TemperatureGauge: View {
     let label: String
     let temperature: Double
-    let history: [Double]
+    let history: HistoryBuffer
 
     var body: some View {
         VStack(spacing: 8) {
@@ -262,6 +269,7 @@ struct TemperatureGauge: View {
                     color: temperatureColor,
                     showArea: true
                 )
+                .equatable()
                 .frame(height: 30)
             }
         }
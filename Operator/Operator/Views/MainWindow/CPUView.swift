@@ -11,6 +11,13 @@ import Charts
 struct CPUView: View {
     @EnvironmentObject var systemMonitor: SystemMonitor
 
+    /// Built once and shared by every area mark, rather than one gradient per sample
+    private static let areaGradient = LinearGradient(
+        colors: [Color.accentColor.opacity(0.4), Color.accentColor.opacity(0.1)],
+        startPoint: .top,
+        endPoint: .bottom
+    )
+
     var body: some View {
         ScrollView {
             VStack(spacing: 16) {
@@ -75,13 +82,7 @@ struct CPUView: View {
                                         x: .value("Time", index),
                                         y: .value("Usage", value)
                                     )
-                                    .foregroundStyle(
-                                        LinearGradient(
-                                            colors: [Color.accentColor.opacity(0.4), Color.accentColor.opacity(0.1)],
-                                            startPoint: .top,
-                                            endPoint: .bottom
-                                        )
-                                    )
+                                    .foregroundStyle(Self.areaGradient)
                                     .interpolationMethod(.catmullRom)
 
                                     LineMark(
@@ -143,13 +144,11 @@ struct CPUView: View {
     }
 
     private var averageUsage: Double? {
-        let history = systemMonitor.cpuMetrics.history
-        guard !history.isEmpty else { return nil }
-        return history.reduce(0, +) / Double(history.count)
+        systemMonitor.cpuMetrics.history.average
     }
 
     private var maxUsage: Double? {
-        systemMonitor.cpuMetrics.history.max()
+        systemMonitor.cpuMetrics.history.maximum
     }
 }
 
@@ -159,6 +158,12 @@ struct CoreUsageCell: View {
     let coreIndex: Int
     let usage: Double
 
+    private static let shortLabels: [String] = (0..<Int(Sysctl.logicalCPUCount)).map { "C\($0)" }
+
+    private var label: String {
+        coreIndex < Self.shortLabels.count ? Self.shortLabels[coreIndex] : "C\(coreIndex)"
+    }
+
     private var status: StatusColor {
         StatusColor.from(percentage: usage)
     }
@@ -179,7 +184,7 @@ struct CoreUsageCell: View {
             }
             .frame(width: 36, height: 36)
 
-            Text("C\(coreIndex)")
+            Text(label)
                 .font(.system(size: 9))
                 .foregroundColor(.secondary)
         }
@@ -9,7 +9,8 @@ import SwiftUI
 import AppKit
 
 struct ContentView: View {
-    @EnvironmentObject var systemMonitor: SystemMonitor
+    // Deliberately not observing SystemMonitor: the window chrome and tab bar
+    // are static, so only the tab views re-render on each metrics tick
     @State private var selectedTab = 0
 
     var body: some View {
@@ -65,9 +66,6 @@ struct ContentView: View {
                 }
             }
         }
-        .onReceive(NotificationCenter.default.publisher(for: NSNotification.Name("ForceRefresh"))) { _ in
-            systemMonitor.forceRefresh()
-        }
     }
 }
 
@@ -93,10 +93,16 @@ struct HistoryView: View {
         let data = historyStore.getData(for: selectedRange)
         guard !data.isEmpty else { return "No data available" }
 
-        let avgCPU = data.map(\.cpuUsage).reduce(0, +) / Double(data.count)
-        let maxCPU = data.map(\.cpuUsage).max() ?? 0
-        let avgMem = data.map(\.memoryUsage).reduce(0, +) / Double(data.count)
-        let maxMem = data.map(\.memoryUsage).max() ?? 0
+        var totalCPU = 0.0, maxCPU = -Double.infinity
+        var totalMem = 0.0, maxMem = -Double.infinity
+        for point in data {
+            totalCPU += point.cpuUsage
+            maxCPU = max(maxCPU, point.cpuUsage)
+            totalMem += point.memoryUsage
+            maxMem = max(maxMem, point.memoryUsage)
+        }
+        let avgCPU = totalCPU / Double(data.count)
+        let avgMem = totalMem / Double(data.count)
 
         return """
         Operator System Metrics Summary
@@ -214,6 +220,12 @@ struct HistoryChartPanel: View {
                         .foregroundColor(.secondary)
                         .frame(height: 200)
                 } else {
+                    let areaGradient = LinearGradient(
+                        colors: [selectedMetric.color.opacity(0.3), selectedMetric.color.opacity(0.05)],
+                        startPoint: .top,
+                        endPoint: .bottom
+                    )
+
                     Chart {
                         ForEach(dataPoints) { point in
                             LineMark(
@@ -226,13 +238,7 @@ struct HistoryChartPanel: View {
                                 x: .value("Time", point.timestamp),
                                 y: .value("Value", valueForMetric(point))
                             )
-                            .foregroundStyle(
-                                LinearGradient(
-                                    colors: [selectedMetric.color.opacity(0.3), selectedMetric.color.opacity(0.05)],
-                                    startPoint: .top,
-                                    endPoint: .bottom
-                                )
-                            )
+                            .foregroundStyle(areaGradient)
                         }
                     }
                     .chartYAxis {
@@ -400,7 +406,8 @@ struct SessionReportsPanel: View {
 struct SessionRow: View {
     let session: SessionSummary
 
-    private let dateFormatter: DateFormatter = {
+    // Shared across rows; a stored formatter would be rebuilt with every row value
+    private static let dateFormatter: DateFormatter = {
         let f = DateFormatter()
         f.dateStyle = .short
         f.timeStyle = .short
@@ -410,7 +417,7 @@ struct SessionRow: View {
     var body: some View {
         HStack {
             VStack(alignment: .leading, spacing: 2) {
-                Text(dateFormatter.string(from: session.startTime))
+                Text(Self.dateFormatter.string(from: session.startTime))
                     .font(.subheadline)
                 Text("Duration: \(session.formattedDuration)")
                     .font(.caption)
@@ -461,7 +468,7 @@ struct SessionDetailView: View {
     let session: SessionSummary
     @Environment(\.dismiss) private var dismiss
 
-    private let dateFormatter: DateFormatter = {
+    private static let dateFormatter: DateFormatter = {
         let f = DateFormatter()
         f.dateStyle = .medium
         f.timeStyle = .short
@@ -480,8 +487,8 @@ struct SessionDetailView: View {
             Divider()
 
             VStack(alignment: .leading, spacing: 12) {
-                DetailItem(label: "Start", value: dateFormatter.string(from: session.startTime))
-                DetailItem(label: "End", value: dateFormatter.string(from: session.endTime))
+                DetailItem(label: "Start", value: Self.dateFormatter.string(from: session.startTime))
+                DetailItem(label: "End", value: Self.dateFormatter.string(from: session.endTime))
                 DetailItem(label: "Duration", value: session.formattedDuration)
 
                 Divider()
@@ -11,6 +11,12 @@ import Charts
 struct MemoryView: View {
     @EnvironmentObject var systemMonitor: SystemMonitor
 
+    private static let areaGradient = LinearGradient(
+        colors: [Color.purple.opacity(0.4), Color.purple.opacity(0.1)],
+        startPoint: .top,
+        endPoint: .bottom
+    )
+
     var body: some View {
         ScrollView {
             VStack(spacing: 16) {
@@ -21,15 +27,15 @@ struct MemoryView: View {
                             SemiCircularGauge(
                                 value: systemMonitor.memoryMetrics.usagePercent,
                                 title: "Memory",
-                                valueLabel: String(format: "%.1f GB", systemMonitor.memoryMetrics.usedGB),
+                                valueLabel: ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.usedBytes),
                                 status: systemMonitor.memoryMetrics.statusColor
                             )
                             .frame(width: 150, height: 100)
 
                             VStack(alignment: .leading, spacing: 8) {
-                                MetricRow("Total", value: String(format: "%.2f GB", systemMonitor.memoryMetrics.totalGB), icon: "square.stack.3d.up")
-                                MetricRow("Used", value: String(format: "%.2f GB", systemMonitor.memoryMetrics.usedGB), icon: "square.stack.3d.up.fill")
-                                MetricRow("Free", value: String(format: "%.2f GB", systemMonitor.memoryMetrics.freeGB), icon: "square.stack")
+                                MetricRow("Total", value: ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.totalBytes, decimals: 2), icon: "square.stack.3d.up")
+                                MetricRow("Used", value: ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.usedBytes, decimals: 2), icon: "square.stack.3d.up.fill")
+                                MetricRow("Free", value: ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.freeBytes, decimals: 2), icon: "square.stack")
                                 MetricRow("Usage", value: PercentFormatter.format(systemMonitor.memoryMetrics.usagePercent),
                                          status: systemMonitor.memoryMetrics.statusColor)
                             }
@@ -110,13 +116,7 @@ struct MemoryView: View {
                                         x: .value("Time", index),
                                         y: .value("Usage", value)
                                     )
-                                    .foregroundStyle(
-                                        LinearGradient(
-                                            colors: [Color.purple.opacity(0.4), Color.purple.opacity(0.1)],
-                                            startPoint: .top,
-                                            endPoint: .bottom
-                                        )
-                                    )
+                                    .foregroundStyle(Self.areaGradient)
                                     .interpolationMethod(.catmullRom)
 
                                     LineMark(
@@ -156,7 +156,7 @@ struct MemoryView: View {
                                     Text("Used")
                                         .font(.caption)
                                         .foregroundColor(.secondary)
-                                    Text(String(format: "%.2f GB", systemMonitor.memoryMetrics.swapUsedGB))
+                                    Text(ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.swapUsedBytes, decimals: 2))
                                         .font(.title3)
                                         .fontWeight(.medium)
                                 }
@@ -167,7 +167,7 @@ struct MemoryView: View {
                                     Text("Total")
                                         .font(.caption)
                                         .foregroundColor(.secondary)
-                                    Text(String(format: "%.2f GB", systemMonitor.memoryMetrics.swapTotalGB))
+                                    Text(ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.swapTotalBytes, decimals: 2))
                                         .font(.title3)
                                         .fontWeight(.medium)
                                 }
@@ -187,9 +187,7 @@ struct MemoryView: View {
     }
 
     private var averageUsage: Double? {
-        let history = systemMonitor.memoryMetrics.history
-        guard !history.isEmpty else { return nil }
-        return history.reduce(0, +) / Double(history.count)
+        systemMonitor.memoryMetrics.history.average
     }
 }
 
@@ -7,7 +7,6 @@
 
 import SwiftUI
 import Charts
-import AppKit
 
 struct NetworkView: View {
     @EnvironmentObject var systemMonitor: SystemMonitor
@@ -129,7 +128,9 @@ struct NetworkView: View {
                     } else {
                         NetworkGraphView(
                             uploadHistory: systemMonitor.networkMetrics.uploadHistory,
-                            downloadHistory: systemMonitor.networkMetrics.downloadHistory
+                            downloadHistory: systemMonitor.networkMetrics.downloadHistory,
+                            uploadSpeed: systemMonitor.networkMetrics.uploadSpeed,
+                            downloadSpeed: systemMonitor.networkMetrics.downloadSpeed
                         )
                         .frame(height: 200)
                     }
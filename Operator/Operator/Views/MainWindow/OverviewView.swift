@@ -37,6 +37,7 @@ struct OverviewView: View {
                                     data: systemMonitor.cpuMetrics.history,
                                     color: systemMonitor.cpuMetrics.statusColor.swiftUIColor
                                 )
+                                .equatable()
                                 .frame(height: 40)
                             }
                         }
@@ -47,9 +48,10 @@ struct OverviewView: View {
                             CircularGauge(
                                 value: systemMonitor.memoryMetrics.usagePercent,
                                 title: "Usage",
-                                subtitle: String(format: "%.1f / %.1f GB",
-                                                systemMonitor.memoryMetrics.usedGB,
-                                                systemMonitor.memoryMetrics.totalGB)
+                                subtitle: ByteFormatter.formatGigabytes(
+                                    used: systemMonitor.memoryMetrics.usedBytes,
+                                    total: systemMonitor.memoryMetrics.totalBytes
+                                )
                             )
                             .frame(height: 120)
 
@@ -63,6 +65,7 @@ struct OverviewView: View {
                                     data: systemMonitor.memoryMetrics.history,
                                     color: systemMonitor.memoryMetrics.statusColor.swiftUIColor
                                 )
+                                .equatable()
                                 .frame(height: 40)
                             }
                         }
@@ -86,6 +89,7 @@ struct OverviewView: View {
                                     uploadData: systemMonitor.networkMetrics.uploadHistory,
                                     downloadData: systemMonitor.networkMetrics.downloadHistory
                                 )
+                                .equatable()
                                 .frame(height: 80)
                             }
 
@@ -111,8 +115,7 @@ struct OverviewView: View {
                                             .font(.subheadline)
                                             .fontWeight(.medium)
                                         Spacer()
-                                        Text(String(format: "%.1f / %.1f GB",
-                                                   volume.usedGB, volume.totalGB))
+                                        Text(ByteFormatter.formatGigabytes(used: volume.usedBytes, total: volume.totalBytes))
                                             .font(.caption)
                                             .foregroundColor(.secondary)
                                     }
@@ -228,6 +231,12 @@ struct OverviewView: View {
             }
             .padding()
         }
+        .onAppear {
+            systemMonitor.setProcessListVisible(true)
+        }
+        .onDisappear {
+            systemMonitor.setProcessListVisible(false)
+        }
     }
 }
 
@@ -301,9 +310,10 @@ struct SystemInfoHeader: View {
                         icon: "memorychip",
                         title: "Memory",
                         value: PercentFormatter.format(systemMonitor.memoryMetrics.usagePercent, decimals: 1),
-                        detail: String(format: "%.1f / %.1f GB",
-                                       systemMonitor.memoryMetrics.usedGB,
-                                       systemMonitor.memoryMetrics.totalGB),
+                        detail: ByteFormatter.formatGigabytes(
+                            used: systemMonitor.memoryMetrics.usedBytes,
+                            total: systemMonitor.memoryMetrics.totalBytes
+                        ),
                         gradient: LinearGradient(
                             colors: [Color.purple.opacity(0.32), Color.indigo.opacity(0.18)],
                             startPoint: .topLeading,
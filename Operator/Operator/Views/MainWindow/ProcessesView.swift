@@ -55,6 +55,8 @@ struct ProcessesView: View {
     }
 
     var body: some View {
+        let processes = filteredProcesses
+
         VStack(spacing: 0) {
             // Toolbar
             HStack(spacing: 16) {
@@ -126,7 +128,7 @@ struct ProcessesView: View {
                 }
 
                 // Process count
-                Text("\(filteredProcesses.count) processes")
+                Text("\(processes.count) processes")
                     .font(.caption)
                     .foregroundColor(.secondary)
             }
@@ -167,7 +169,7 @@ struct ProcessesView: View {
             // Process list
             ScrollView {
                 LazyVStack(spacing: 0) {
-                    ForEach(filteredProcesses) { process in
+                    ForEach(processes) { process in
                         ProcessRow(
                             process: process,
                             isSelected: selectedProcess?.id == process.id,
@@ -175,6 +177,7 @@ struct ProcessesView: View {
                                 performAction(action, on: process)
                             }
                         )
+                        .equatable()
                         .onTapGesture {
                             selectedProcess = process
                         }
@@ -204,6 +207,12 @@ struct ProcessesView: View {
                 output: showSampleOutput ?? ""
             )
         }
+        .onAppear {
+            systemMonitor.setProcessListVisible(true)
+        }
+        .onDisappear {
+            systemMonitor.setProcessListVisible(false)
+        }
     }
 
     private func toggleSort(_ key: ProcessSortKey) {
@@ -252,7 +261,7 @@ struct QuickFiltersBar: View {
                 FilterPill(
                     title: state.rawValue,
                     isSelected: filterState == state,
-                    color: stateColor(state)
+                    color: state.color
                 ) {
                     filterState = state
                 }
@@ -264,16 +273,6 @@ struct QuickFiltersBar: View {
         .padding(.vertical, 8)
         .background(Color.primary.opacity(0.03))
     }
-
-    private func stateColor(_ state: ProcessState) -> Color {
-        switch state {
-        case .running: return .green
-        case .sleeping: return .blue
-        case .stopped: return .orange
-        case .zombie: return .red
-        case .unknown: return .gray
-        }
-    }
 }
 
 struct FilterPill: View {
@@ -366,11 +365,29 @@ struct TableHeader: View {
 
 // MARK: - Process Row
 
-struct ProcessRow: View {
+struct ProcessRow: View, Equatable {
     let process: ProcessInfoModel
     let isSelected: Bool
     let onAction: (ProcessAction) -> Void
 
+    /// Compares what the row displays, so rows whose visible values didn't change
+    /// between refreshes are skipped. ProcessInfoModel's own == only checks the PID.
+    static func == (lhs: ProcessRow, rhs: ProcessRow) -> Bool {
+        let old = lhs.process
+        let new = rhs.process
+        return lhs.isSelected == rhs.isSelected
+            && old.id == new.id
+            && old.name == new.name
+            && old.user == new.user
+            && (old.cpuUsage * 10).rounded() == (new.cpuUsage * 10).rounded()
+            && old.cpuStatusColor == new.cpuStatusColor
+            && (old.memoryUsage * 10).rounded() == (new.memoryUsage * 10).rounded()
+            && old.formattedMemory == new.formattedMemory
+            && old.threads == new.threads
+            && old.state == new.state
+            && old.path == new.path
+    }
+
     var body: some View {
         HStack(spacing: 0) {
             // PID
@@ -435,7 +452,7 @@ struct ProcessRow: View {
             HStack(spacing: 4) {
                 Image(systemName: process.state.icon)
                     .font(.system(size: 10))
-                    .foregroundColor(stateColor)
+                    .foregroundColor(process.state.color)
                 Text(process.state.rawValue)
                     .font(.caption2)
             }
@@ -449,16 +466,6 @@ struct ProcessRow: View {
             ProcessContextMenu(process: process, onAction: onAction)
         }
     }
-
-    private var stateColor: Color {
-        switch process.state {
-        case .running: return .green
-        case .sleeping: return .blue
-        case .stopped: return .orange
-        case .zombie: return .red
-        case .unknown: return .gray
-        }
-    }
 }
 
 // MARK: - Process Context Menu
@@ -52,7 +52,7 @@ struct MenuBarView: View {
                 QuickMetricRow(
                     icon: "memorychip",
                     label: "Memory",
-                    value: String(format: "%.1f GB", systemMonitor.memoryMetrics.usedGB),
+                    value: ByteFormatter.formatGigabytes(systemMonitor.memoryMetrics.usedBytes),
                     status: systemMonitor.memoryMetrics.statusColor,
                     sparkline: systemMonitor.memoryMetrics.history
                 )
@@ -172,6 +172,12 @@ struct MenuBarView: View {
         }
         .padding()
         .frame(width: 300)
+        .onAppear {
+            systemMonitor.setProcessListVisible(true)
+        }
+        .onDisappear {
+            systemMonitor.setProcessListVisible(false)
+        }
     }
 
     private func openMainWindow() {
@@ -191,7 +197,7 @@ struct QuickMetricRow: View {
     let label: String
     let value: String
     let status: StatusColor
-    let sparkline: [Double]
+    let sparkline: HistoryBuffer
 
     var body: some View {
         HStack(spacing: 8) {
@@ -204,6 +210,7 @@ struct QuickMetricRow: View {
                 .frame(width: 50, alignment: .leading)
 
             SparklineView(data: sparkline, color: status.swiftUIColor, showArea: false)
+                .equatable()
                 .frame(height: 16)
 
             Text(value)